@@ -0,0 +1,194 @@
+"""
+Build Your Model Wizard - Shared state, navigation and cached helpers.
+
+Each wizard step lives in its own page under ``pages/`` (1a_upload ... 1e_deploy)
+so a rerun only evaluates the current step. Steps share ``st.session_state``
+and move between each other with ``go_to``, which records the step in
+``st.query_params`` and switches page. A step counts as done only once its
+page calls ``complete``; opening a later step directly sends the user back
+to the first unfinished one.
+"""
+
+import hashlib
+import io
+import math
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+# Uploads above this size are previewed first and fully parsed on "Next"
+LARGE_UPLOAD_BYTES = 50 * 1024 * 1024
+PREVIEW_ROWS = 200
+
+# Wizard steps (query-param key, icon, name, page)
+STEPS = (
+    ("upload", "📊", "Upload Data", "pages/1a_upload.py"),
+    ("brand", "🎨", "Define Brand", "pages/1b_brand.py"),
+    ("config", "⚙️", "Configure", "pages/1c_config.py"),
+    ("train", "🚀", "Train", "pages/1d_train.py"),
+    ("deploy", "✅", "Deploy", "pages/1e_deploy.py"),
+)
+STEP_KEYS = tuple(step[0] for step in STEPS)
+STEP_PAGES = {step[0]: step[3] for step in STEPS}
+
+
+@st.cache_data
+def _css() -> str:
+    """Load the wizard stylesheet once per server process."""
+    return (Path(__file__).parent / "pages" / "build_style.css").read_text()
+
+
+@st.cache_data
+def _step_html(current: int) -> list[str]:
+    """Prerendered step-indicator markup for the given current step."""
+    html = []
+    for idx, (_, icon, name, _) in enumerate(STEPS):
+        if idx < current:
+            html.append(f'<div class="step-completed">✅ {icon} {name}</div>')
+        elif idx == current:
+            html.append(f'<div class="step-active">👉 {icon} {name}</div>')
+        else:
+            html.append(f'<div class="step-pending">⏳ {icon} {name}</div>')
+    return html
+
+
+def init_state():
+    """Initialize the session state shared by all wizard pages."""
+    if 'build_step' not in st.session_state:
+        st.session_state.build_step = STEP_KEYS[0]
+    if 'upload_meta' not in st.session_state:
+        st.session_state.upload_meta = None  # name/fingerprint/stats only; the DataFrame stays in the parse cache
+    if 'training_config' not in st.session_state:
+        st.session_state.training_config = training_estimate(3, "Balanced", 16)
+    if 'training_progress' not in st.session_state:
+        st.session_state.training_progress = 0
+    if 'completed_steps' not in st.session_state:
+        st.session_state.completed_steps = set()
+
+
+def go_to(step: str):
+    """Record ``step`` in session state and the URL, then switch to its page."""
+    st.session_state.build_step = step
+    st.query_params["step"] = step
+    st.switch_page(STEP_PAGES[step])
+
+
+def complete(step: str):
+    """Mark ``step`` as done so later steps can be opened."""
+    st.session_state.completed_steps.add(step)
+
+
+def restart():
+    """Forget all progress and return to the first step."""
+    st.session_state.completed_steps = set()
+    st.session_state.training_progress = 0
+    go_to(STEP_KEYS[0])
+
+
+def render_page(step: str):
+    """Page config, styles, header and step indicators for a wizard page.
+
+    Every earlier step must be complete; otherwise the user is sent to the
+    first unfinished one.
+    """
+    st.set_page_config(
+        page_title="Build Your Model",
+        page_icon="🏭",
+        layout="wide"
+    )
+    init_state()
+
+    done = st.session_state.completed_steps
+    for earlier in STEP_KEYS[:STEP_KEYS.index(step)]:
+        if earlier not in done:
+            go_to(earlier)
+
+    st.session_state.build_step = step
+    st.query_params["step"] = step
+
+    st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
+
+    # Header
+    st.title("🏭 Build Your Proprietary Manufacturer LoRA")
+    st.markdown("**Follow this wizard to create your competitive advantage AI**")
+
+    current_step = STEP_KEYS.index(step)
+
+    # Progress bar
+    progress = (current_step + 1) / len(STEPS)
+    st.progress(progress, text=f"Step {current_step + 1} of {len(STEPS)}")
+
+    # Step indicators
+    for col, html in zip(st.columns(len(STEPS)), _step_html(current_step)):
+        col.markdown(html, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+
+# Parsed uploads are keyed on the raw bytes, so keep only a few and expire them
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def parse_uploaded_csv(name: str, data: bytes, **read_kwargs) -> pd.DataFrame:
+    """Parse an uploaded CSV once per unique (name, content, options) combination."""
+    return pd.read_csv(io.BytesIO(data), **read_kwargs)
+
+
+def parse_full_upload(name: str, data: bytes, preview: pd.DataFrame) -> pd.DataFrame:
+    """Full parse of a large upload with the PyArrow engine, seeded by preview dtypes.
+
+    Only float and text columns are pinned: an integer column in the first
+    rows may still contain nulls further down.
+    """
+    dtype = {col: ('float64' if dt.kind == 'f' else 'string')
+             for col, dt in preview.dtypes.items() if dt.kind in 'fO'}
+    return parse_uploaded_csv(name, data, engine="pyarrow", dtype=dtype)
+
+
+@st.cache_data(show_spinner=False)
+def dataset_stats(fingerprint: str, _df: pd.DataFrame) -> dict:
+    """Record count, column count and completeness, computed once per dataset.
+
+    ``_df`` is excluded from Streamlit's argument hashing; ``fingerprint``
+    (a digest of the uploaded bytes) identifies the dataset instead.
+    """
+    rows, cols = _df.shape
+    null_mask = _df.isna().to_numpy()  # contiguous bool array; one reduction below
+    return {
+        "rows": rows,
+        "cols": cols,
+        "completeness": (1 - null_mask.sum() / null_mask.size) * 100 if null_mask.size else 0.0,
+        "memory_mb": _df.memory_usage(deep=True).sum() / 1e6,
+    }
+
+
+def upload_meta(name: str, data: bytes, df: pd.DataFrame) -> dict:
+    """Session-state record for a parsed upload: name, content digest and stats."""
+    fingerprint = hashlib.sha256(data).hexdigest()
+    return {"name": name, "fingerprint": fingerprint, **dataset_stats(fingerprint, df)}
+
+
+@st.fragment
+def paginated_preview(df: pd.DataFrame, memory_mb: float):
+    """Preview one page of the upload; paging reruns only this fragment."""
+    col_size, col_page, col_mem = st.columns(3)
+    with col_size:
+        page_size = st.selectbox("Rows/page", [10, 50, 100], index=0)
+    with col_page:
+        page = st.number_input("Page", 1, max(1, math.ceil(len(df) / page_size)), 1)
+    with col_mem:
+        st.metric("In-memory size", f"{memory_mb:.1f} MB")
+
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True)
+
+
+def training_estimate(epochs: int, learning_rate: str, lora_rank: int) -> dict:
+    """Training config plus its time and GPU cost estimate."""
+    training_mins = epochs * 15
+    return {
+        "epochs": epochs,
+        "learning_rate": learning_rate,
+        "lora_rank": lora_rank,
+        "training_mins": training_mins,
+        "cost": training_mins * 0.18,
+    }
@@ -1,85 +1,237 @@
 """Federation graph visualization component."""
 
-import streamlit as st
-from typing import List, Dict, Any, Optional
-import graphviz
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
+from xml.sax.saxutils import escape
+
+if TYPE_CHECKING:
+    import graphviz
+
+
+# Fixed endpoints of the composition chain
+_BASE_NODE = MappingProxyType({
+    'label': 'Generic LLM\n(Llama 3.1 8B)\n\n• General reasoning\n• Tool use\n• Schema comprehension',
+    'fillcolor': '#f0f9ff',
+    'color': '#0284c7',
+    'fontcolor': '#0c4a6e'
+})
+_ORCHESTRATOR_NODE = MappingProxyType({
+    'label': 'Agent Orchestrator\n\n• Task routing\n• Tool execution\n• Result aggregation',
+    'fillcolor': '#f3e8ff',
+    'color': '#9333ea',
+    'fontcolor': '#581c87'
+})
+
+# Static per-adapter node styling, shared read-only across reruns
+_ADAPTER_CONFIGS = MappingProxyType({
+    'industry_retail_media': MappingProxyType({
+        'label': 'Industry LoRA\n(Retail Media)\n\n• RMIS schema\n• Clean room protocols\n• Campaign metrics',
+        'fillcolor': '#dbeafe',
+        'color': '#2563eb',
+        'fontcolor': '#1e293b'
+    }),
+    'manufacturer_brand_x': MappingProxyType({
+        'label': 'Manufacturer LoRA\n(Brand X)\n\n• Brand tone\n• Product hierarchies\n• Private metrics',
+        'fillcolor': '#fef3c7',
+        'color': '#f59e0b',
+        'fontcolor': '#1e293b'
+    }),
+    'task_planning': MappingProxyType({
+        'label': 'Task LoRA\n(Planning)\n\n• Budget allocation\n• Tool calling\n• Constraints',
+        'fillcolor': '#dcfce7',
+        'color': '#16a34a',
+        'fontcolor': '#1e293b'
+    }),
+    'task_creative': MappingProxyType({
+        'label': 'Task LoRA\n(Creative)\n\n• Copy generation\n• Policy compliance\n• Tone adaptation',
+        'fillcolor': '#fce7f3',
+        'color': '#db2777',
+        'fontcolor': '#1e293b'
+    })
+})
+
+# Active adapter card display info
+_ADAPTER_INFO = MappingProxyType({
+    'industry_retail_media': MappingProxyType({
+        'name': 'Industry LoRA',
+        'icon': '🏢',
+        'color': '#2563eb'
+    }),
+    'manufacturer_brand_x': MappingProxyType({
+        'name': 'Manufacturer LoRA',
+        'icon': '🏭',
+        'color': '#f59e0b'
+    }),
+    'task_planning': MappingProxyType({
+        'name': 'Planning Task',
+        'icon': '📊',
+        'color': '#16a34a'
+    }),
+    'task_creative': MappingProxyType({
+        'name': 'Creative Task',
+        'icon': '✨',
+        'color': '#db2777'
+    })
+})
+
+# Active adapter card markup, filled from an ``_ADAPTER_INFO`` entry
+_CARD_TMPL = (
+    '<div style="flex: 1; padding: 1rem; border-radius: 0.5rem; '
+    'border: 2px solid {color}; background: white; text-align: center;">'
+    '<div style="font-size: 2rem;">{icon}</div>'
+    '<div style="font-weight: 600; color: {color};">{name}</div>'
+    '<div style="font-size: 0.75rem; color: #64748b;">✓ Active</div>'
+    '</div>'
+).format_map
+
+# Clean room vs full data metrics table, filled from the pre-formatted
+# comparison dict produced by FederationDemoWorkflow.step_4_compare_results
+_COMPARISON_TMPL = (
+    '<table style="width: 100%; border-collapse: collapse; font-family: sans-serif; '
+    'text-align: center;">'
+    '<tr style="color: #64748b; font-size: 0.85rem;">'
+    '<th></th><th>iROAS</th><th>Revenue</th><th>SKUs Optimized</th></tr>'
+    '<tr style="font-size: 1.5rem; border-top: 1px solid #e2e8f0;">'
+    '<td style="font-size: 0.85rem; color: #64748b;">Full Data</td>'
+    '<td>{full_roas_fmt}</td><td>{full_revenue_fmt}</td><td>{full_data_skus}</td></tr>'
+    '<tr style="color: #16a34a; font-size: 0.9rem;">'
+    '<td></td><td>↑ {roas_delta_fmt}</td><td>↑ {revenue_delta_fmt}</td><td>↑ {sku_delta_fmt}</td></tr>'
+    '<tr style="font-size: 1.5rem; border-top: 1px solid #e2e8f0;">'
+    '<td style="font-size: 0.85rem; color: #64748b;">Clean Room Only</td>'
+    '<td>{clean_roas_fmt}</td><td>{clean_revenue_fmt}</td><td>{clean_room_skus}</td></tr>'
+    '</table>'
+).format_map
+
+# Analytic layout of the vertical composition chain (SVG user units)
+_NODE_WIDTH = 280
+_NODE_HEIGHT = 110
+_NODE_GAP = 40
+_LINE_HEIGHT = 15
+_SVG_MARGIN = 10
+_EDGE_COLOR = '#3b82f6'
 
 
 def build_federation_graph(
     adapters: List[str],
     composition_data: Optional[Dict[str, Any]] = None
-) -> graphviz.Digraph:
+) -> "graphviz.Digraph":
     """
     Build a graphviz graph showing adapter composition.
     
+    The Streamlit view draws the analytic SVG from ``_render_svg`` instead;
+    this builder is kept for callers that want a Digraph, and graphviz is
+    only imported when it is called.
+    
     Args:
         adapters: List of adapter IDs in composition order
-        composition_data: Optional detailed composition data
+        composition_data: Optional detailed composition data (not used in the graph)
         
     Returns:
         Graphviz Digraph object
     """
+    import graphviz
+    
     graph = graphviz.Digraph(comment='LoRA Federation')
     graph.attr(rankdir='TB', bgcolor='transparent')
     graph.attr('node', shape='box', style='rounded,filled', fontname='Arial')
     graph.attr('edge', color='#3b82f6', penwidth='2')
     
     # Base model
-    graph.node('base', 
-               'Generic LLM\n(Llama 3.1 8B)\n\n• General reasoning\n• Tool use\n• Schema comprehension',
-               fillcolor='#f0f9ff', color='#0284c7', fontcolor='#0c4a6e')
+    graph.node('base', _BASE_NODE['label'],
+               fillcolor=_BASE_NODE['fillcolor'], color=_BASE_NODE['color'],
+               fontcolor=_BASE_NODE['fontcolor'])
     
     # Track previous node for edges
     prev_node = 'base'
     
     # Add adapter nodes
-    adapter_configs = {
-        'industry_retail_media': {
-            'label': 'Industry LoRA\n(Retail Media)\n\n• RMIS schema\n• Clean room protocols\n• Campaign metrics',
-            'fillcolor': '#dbeafe',
-            'color': '#2563eb'
-        },
-        'manufacturer_brand_x': {
-            'label': 'Manufacturer LoRA\n(Brand X)\n\n• Brand tone\n• Product hierarchies\n• Private metrics',
-            'fillcolor': '#fef3c7',
-            'color': '#f59e0b'
-        },
-        'task_planning': {
-            'label': 'Task LoRA\n(Planning)\n\n• Budget allocation\n• Tool calling\n• Constraints',
-            'fillcolor': '#dcfce7',
-            'color': '#16a34a'
-        },
-        'task_creative': {
-            'label': 'Task LoRA\n(Creative)\n\n• Copy generation\n• Policy compliance\n• Tone adaptation',
-            'fillcolor': '#fce7f3',
-            'color': '#db2777'
-        }
-    }
-    
     for adapter_id in adapters:
-        if adapter_id in adapter_configs:
-            config = adapter_configs[adapter_id]
-            node_id = adapter_id
-            
-            graph.node(node_id,
-                      config['label'],
-                      fillcolor=config['fillcolor'],
-                      color=config['color'],
-                      fontcolor='#1e293b')
-            
-            # Add edge from previous node
-            graph.edge(prev_node, node_id)
-            prev_node = node_id
+        config = _ADAPTER_CONFIGS.get(adapter_id)
+        if config is None:
+            continue
+        
+        graph.node(adapter_id,
+                   config['label'],
+                   fillcolor=config['fillcolor'],
+                   color=config['color'],
+                   fontcolor=config['fontcolor'])
+        
+        # Add edge from previous node
+        graph.edge(prev_node, adapter_id)
+        prev_node = adapter_id
     
     # Agent orchestrator
-    graph.node('orchestrator',
-               'Agent Orchestrator\n\n• Task routing\n• Tool execution\n• Result aggregation',
-               fillcolor='#f3e8ff', color='#9333ea', fontcolor='#581c87')
+    graph.node('orchestrator', _ORCHESTRATOR_NODE['label'],
+               fillcolor=_ORCHESTRATOR_NODE['fillcolor'], color=_ORCHESTRATOR_NODE['color'],
+               fontcolor=_ORCHESTRATOR_NODE['fontcolor'])
     graph.edge(prev_node, 'orchestrator')
     
     return graph
 
 
+def _node_svg(idx: int, y: int, node: Dict[str, str]) -> str:
+    """SVG group for one node box with its centred multi-line label."""
+    center_x = _SVG_MARGIN + _NODE_WIDTH // 2
+    lines = node['label'].split('\n')
+    first_baseline = y + (_NODE_HEIGHT - len(lines) * _LINE_HEIGHT) // 2 + _LINE_HEIGHT - 3
+    texts = ''.join(
+        f'<text x="{center_x}" y="{first_baseline + i * _LINE_HEIGHT}">{escape(line)}</text>'
+        for i, line in enumerate(lines) if line
+    )
+    return (
+        f'<g id="node{idx}" class="node">'
+        f'<rect x="{_SVG_MARGIN}" y="{y}" width="{_NODE_WIDTH}" height="{_NODE_HEIGHT}" rx="8" '
+        f'fill="{node["fillcolor"]}" stroke="{node["color"]}" stroke-width="1.5"/>'
+        f'<g fill="{node["fontcolor"]}">{texts}</g>'
+        '</g>'
+    )
+
+
+def _edge_svg(idx: int, y_from: int, y_to: int) -> str:
+    """SVG group for the arrow between two vertically stacked nodes."""
+    center_x = _SVG_MARGIN + _NODE_WIDTH // 2
+    return (
+        f'<g id="edge{idx}" class="edge">'
+        f'<line x1="{center_x}" y1="{y_from}" x2="{center_x}" y2="{y_to - 2}" '
+        f'stroke="{_EDGE_COLOR}" stroke-width="2" marker-end="url(#arrow)"/>'
+        '</g>'
+    )
+
+
+@lru_cache(maxsize=32)
+def _render_svg(adapters_key: Tuple[str, ...]) -> str:
+    """Render the composition chain as SVG once per adapter tuple.
+    
+    The topology is a fixed vertical chain (base → adapters → orchestrator),
+    so node positions are computed directly instead of running Graphviz.
+    """
+    nodes = [
+        _BASE_NODE,
+        *[config for a in adapters_key if (config := _ADAPTER_CONFIGS.get(a)) is not None],
+        _ORCHESTRATOR_NODE,
+    ]
+    
+    step = _NODE_HEIGHT + _NODE_GAP
+    parts = []
+    for idx, node in enumerate(nodes):
+        y = _SVG_MARGIN + idx * step
+        if idx:
+            parts.append(_edge_svg(idx, y - _NODE_GAP, y))
+        parts.append(_node_svg(idx + 1, y, node))
+    
+    width = _NODE_WIDTH + 2 * _SVG_MARGIN
+    height = len(nodes) * step - _NODE_GAP + 2 * _SVG_MARGIN
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="Arial" font-size="12" text-anchor="middle">'
+        '<defs><marker id="arrow" markerWidth="10" markerHeight="8" refX="9" refY="4" orient="auto">'
+        f'<path d="M0,0 L10,4 L0,8 z" fill="{_EDGE_COLOR}"/></marker></defs>'
+        f'<g id="graph0" class="graph">{"".join(parts)}</g>'
+        '</svg>'
+    )
+
+
 def render_federation_graph(
     adapters: List[str],
     composition_data: Optional[Dict[str, Any]] = None,
@@ -93,56 +245,33 @@ def render_federation_graph(
         composition_data: Optional composition metadata
         show_metrics: Whether to show performance metrics
     """
+    import streamlit as st
+    
+    st.fragment(_graph_fragment)(adapters, composition_data, show_metrics)
+
+
+def _graph_fragment(
+    adapters: List[str],
+    composition_data: Optional[Dict[str, Any]],
+    show_metrics: bool
+) -> None:
+    """Graph, adapter cards and metrics, rerun only by their own interactions."""
+    import streamlit as st
+    import streamlit.components.v1 as components
+    
     st.subheader("🔗 Federation Composition")
     
-    # Build and display graph
-    graph = build_federation_graph(adapters, composition_data)
-    st.graphviz_chart(graph)
+    # Display pre-rendered graph
+    st.image(_render_svg(tuple(adapters)))
     
-    # Show active adapters
+    # Show active adapters as a single static HTML row (no markdown parsing)
     st.markdown("### Active Adapters")
-    cols = st.columns(len(adapters) if adapters else 1)
-    
-    adapter_info = {
-        'industry_retail_media': {
-            'name': 'Industry LoRA',
-            'icon': '🏢',
-            'color': '#2563eb'
-        },
-        'manufacturer_brand_x': {
-            'name': 'Manufacturer LoRA',
-            'icon': '🏭',
-            'color': '#f59e0b'
-        },
-        'task_planning': {
-            'name': 'Planning Task',
-            'icon': '📊',
-            'color': '#16a34a'
-        },
-        'task_creative': {
-            'name': 'Creative Task',
-            'icon': '✨',
-            'color': '#db2777'
-        }
-    }
+    cards = [_CARD_TMPL(info) for a in adapters if (info := _ADAPTER_INFO.get(a)) is not None]
     
-    for idx, adapter_id in enumerate(adapters):
-        if adapter_id in adapter_info:
-            info = adapter_info[adapter_id]
-            with cols[idx]:
-                st.markdown(f"""
-                <div style="
-                    padding: 1rem;
-                    border-radius: 0.5rem;
-                    border: 2px solid {info['color']};
-                    background: white;
-                    text-align: center;
-                ">
-                    <div style="font-size: 2rem;">{info['icon']}</div>
-                    <div style="font-weight: 600; color: {info['color']};">{info['name']}</div>
-                    <div style="font-size: 0.75rem; color: #64748b;">✓ Active</div>
-                </div>
-                """, unsafe_allow_html=True)
+    components.html(
+        '<div style="display: flex; gap: 1rem; font-family: sans-serif;">' + ''.join(cards) + '</div>',
+        height=140
+    )
     
     # Show metrics if available
     if show_metrics and composition_data:
@@ -181,49 +310,13 @@ def render_comparison_chart(comparison: Dict[str, Any]) -> None:
     Args:
         comparison: Comparison result dict
     """
-    st.subheader("📊 Clean Room vs Federation Comparison")
+    import streamlit as st
+    import streamlit.components.v1 as components
     
-    # Metrics comparison
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("#### iROAS")
-        st.metric(
-            "Full Data",
-            f"{comparison.get('full_data_roas', 0):.2f}x",
-            delta=f"{comparison.get('roas_delta_pct', 0):.1f}%",
-            delta_color="normal"
-        )
-        st.metric(
-            "Clean Room Only",
-            f"{comparison.get('clean_room_roas', 0):.2f}x"
-        )
-    
-    with col2:
-        st.markdown("#### Revenue")
-        st.metric(
-            "Full Data",
-            f"${comparison.get('full_data_revenue', 0):,.0f}",
-            delta=f"{comparison.get('revenue_delta_pct', 0):.1f}%",
-            delta_color="normal"
-        )
-        st.metric(
-            "Clean Room Only",
-            f"${comparison.get('clean_room_revenue', 0):,.0f}"
-        )
+    st.subheader("📊 Clean Room vs Federation Comparison")
     
-    with col3:
-        st.markdown("#### SKUs Optimized")
-        st.metric(
-            "Full Data",
-            comparison.get('full_data_skus', 0),
-            delta=f"{comparison.get('sku_delta_pct', 0):.1f}%",
-            delta_color="normal"
-        )
-        st.metric(
-            "Clean Room Only",
-            comparison.get('clean_room_skus', 0)
-        )
+    # Metrics comparison as a single static table (one component mount)
+    components.html(_COMPARISON_TMPL(comparison), height=260)
     
     # Missing capabilities
     st.markdown("### 🚫 Capabilities Unavailable in Clean Room")
@@ -252,6 +345,8 @@ def render_adapter_details(adapter_id: str, metadata: Dict[str, Any]) -> None:
         adapter_id: Adapter identifier
         metadata: Adapter metadata
     """
+    import streamlit as st
+    
     st.markdown(f"### {metadata.get('name', adapter_id)}")
     
     col1, col2 = st.columns([2, 1])
@@ -0,0 +1,90 @@
+"""Cumulative-value chart for the welcome page.
+
+The chart data is static, so the figure is serialized once to
+``pages/welcome_fig.json`` and the page only deserializes it. Regenerate
+the JSON after editing the chart::
+
+    python -m components.welcome_figure
+"""
+
+from pathlib import Path
+
+import plotly.graph_objects as go
+
+FIGURE_JSON = Path(__file__).parent.parent / "pages" / "welcome_fig.json"
+
+
+def build_value_fig() -> go.Figure:
+    """Build the cumulative-value stacked bar chart."""
+    fig = go.Figure()
+
+    categories = ['ROAS', 'Prediction Accuracy', 'SKU Coverage', 'Margin Optimization']
+    generic_llm = [2.1, 45, 60, 30]
+    plus_industry = [2.8, 67, 85, 55]
+    plus_manufacturer = [3.5, 89, 98, 87]
+
+    # Calculate incremental values
+    industry_increment = [plus_industry[i] - generic_llm[i] for i in range(len(categories))]
+    manufacturer_increment = [plus_manufacturer[i] - plus_industry[i] for i in range(len(categories))]
+
+    fig.add_trace(go.Bar(
+        name='🧠 Generic LLM Only',
+        x=categories,
+        y=generic_llm,
+        marker_color='#9E9E9E',
+        text=[f'{v}{"x" if i==0 else "%"}' for i, v in enumerate(generic_llm)],
+        textposition='inside',
+        hovertemplate='<b>Generic LLM</b><br>%{x}: %{y}<extra></extra>'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='🏢 + Industry LoRA',
+        x=categories,
+        y=industry_increment,
+        marker_color='#2196F3',
+        text=[f'+{v}{"x" if i==0 else "%"}' for i, v in enumerate(industry_increment)],
+        textposition='inside',
+        hovertemplate='<b>Industry LoRA Adds</b><br>%{x}: +%{y}<extra></extra>',
+        base=generic_llm
+    ))
+
+    fig.add_trace(go.Bar(
+        name='🏭 + YOUR Manufacturer LoRA',
+        x=categories,
+        y=manufacturer_increment,
+        marker_color='#4CAF50',
+        text=[f'+{v}{"x" if i==0 else "%"}' for i, v in enumerate(manufacturer_increment)],
+        textposition='inside',
+        hovertemplate='<b>YOUR LoRA Adds</b><br>%{x}: +%{y}<extra></extra>',
+        base=plus_industry
+    ))
+
+    fig.update_layout(
+        barmode='stack',
+        title={
+            'text': 'Cumulative Value of Each LoRA Layer',
+            'font': {'size': 20, 'family': 'Archivo'}
+        },
+        xaxis_title='Capability',
+        yaxis_title='Performance',
+        height=500,
+        font=dict(family="Archivo", size=14),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        hovermode='x unified'
+    )
+    
+    return fig
+
+
+if __name__ == "__main__":
+    fig = build_value_fig()
+    # Leave the default template out of the file; pio.from_json applies it on load
+    fig.layout.template = None
+    FIGURE_JSON.write_text(fig.to_json())
+    print(f"✅ Wrote {FIGURE_JSON}")
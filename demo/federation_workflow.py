@@ -11,12 +11,17 @@ This workflow demonstrates:
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 
 from crewai import Task, Process
 
@@ -39,6 +44,62 @@ from demo.tools.creatives import CreativeGenerator
 
 logger = logging.getLogger(__name__)
 
+# Static federation composition descriptor, shared by all runs (treat as read-only)
+_FEDERATION_GRAPH_DESCRIPTOR = {
+    "layers": [
+        {
+            "name": "Generic LLM",
+            "type": "base",
+            "model": "Llama 3.1 8B",
+            "capabilities": ["General reasoning", "Tool use", "Schema comprehension"]
+        },
+        {
+            "name": "Industry LoRA",
+            "type": "industry",
+            "adapter_id": "industry_retail_media",
+            "capabilities": ["RMIS schema", "Clean room protocols", "Campaign metrics"]
+        },
+        {
+            "name": "Manufacturer LoRA",
+            "type": "manufacturer",
+            "adapter_id": "manufacturer_brand_x",
+            "capabilities": ["Brand tone", "Product hierarchies", "Private metrics"]
+        },
+        {
+            "name": "Task LoRA",
+            "type": "task",
+            "adapter_id": "task_planning",
+            "capabilities": ["Budget allocation", "Tool calling", "Constraint satisfaction"]
+        }
+    ],
+    "composition_strategy": "sequential",
+    "total_parameters": "8.5B",
+    "lora_parameters": "67M",
+    "composition_time_ms": 1850
+}
+
+
+# Stateless tool singletons: constructors load data files, so build each only once.
+# The warehouse holds a DuckDB connection and is created per workflow instead.
+@lru_cache(maxsize=1)
+def _get_optimizer() -> BudgetOptimizer:
+    return BudgetOptimizer()
+
+
+@lru_cache(maxsize=1)
+def _get_clean_room() -> CleanRoomConnector:
+    return CleanRoomConnector()
+
+
+@lru_cache(maxsize=1)
+def _get_policy_checker() -> PolicyChecker:
+    return PolicyChecker()
+
+
+@lru_cache(maxsize=1)
+def _get_creative_gen() -> CreativeGenerator:
+    return CreativeGenerator()
+
 
 class FederationDemoWorkflow:
     """
@@ -73,12 +134,13 @@ class FederationDemoWorkflow:
             )
             self.federation = LoRAFederation(config=config)
         
-        # Initialize tools
+        # Initialize tools (stateless ones shared across workflow instances;
+        # each workflow owns its warehouse and DuckDB connection)
         self.warehouse = WarehouseManager()
-        self.optimizer = BudgetOptimizer()
-        self.clean_room = CleanRoomConnector()
-        self.policy_checker = PolicyChecker()
-        self.creative_gen = CreativeGenerator()
+        self.optimizer = _get_optimizer()
+        self.clean_room = _get_clean_room()
+        self.policy_checker = _get_policy_checker()
+        self.creative_gen = _get_creative_gen()
         
         logger.info("Federation Demo Workflow initialized")
     
@@ -98,53 +160,70 @@ class FederationDemoWorkflow:
         logger.info("Starting full federation demo workflow")
         
         results = {
-            "workflow_id": str(uuid.uuid4()),
+            "workflow_id": uuid.uuid4().hex,
             "timestamp": datetime.utcnow().isoformat(),
             "steps": {}
         }
         
+        for event in self.run_full_demo_stream(user_input):
+            results["steps"][event["step"]] = event["data"]
+        
+        logger.info("Demo workflow completed successfully")
+        return results
+    
+    def run_full_demo_stream(
+        self,
+        user_input: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run the demo workflow, yielding each step's result as it completes.
+        
+        Args:
+            user_input: User input with objective, budget, constraints
+            
+        Yields:
+            ``{"step": name, "data": result}`` for harmonization, full_plan,
+            clean_room_plan, comparison, creatives and visualization, in order
+        """
         # Step 1: Data Harmonization
         logger.info("Step 1: Data Harmonization")
-        harmonization_result = self.step_1_harmonize_data()
-        results["steps"]["harmonization"] = harmonization_result
+        yield {"step": "harmonization", "data": self.step_1_harmonize_data()}
         
-        # Step 2: Generate Plan (Full Data)
-        logger.info("Step 2: Generate Plan with Full Data")
-        full_plan = self.step_2_generate_plan(user_input, clean_room_mode=False)
-        results["steps"]["full_plan"] = full_plan
+        # Steps 2 & 3: Generate Plans (Full Data and Clean Room Only)
+        # The two plans are independent, so run them concurrently
+        logger.info("Steps 2-3: Generate Plans with Full Data and Clean Room Only")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            full_future = executor.submit(self.step_2_generate_plan, user_input, False)
+            clean_room_future = executor.submit(self.step_2_generate_plan, user_input, True)
+            full_plan = full_future.result()
+            clean_room_plan = clean_room_future.result()
         
-        # Step 3: Generate Plan (Clean Room Only)
-        logger.info("Step 3: Generate Plan with Clean Room Only")
-        clean_room_plan = self.step_2_generate_plan(user_input, clean_room_mode=True)
-        results["steps"]["clean_room_plan"] = clean_room_plan
+        # Yield outside the executor block, so a consumer that stops early
+        # does not hold the pool open until the generator is collected
+        yield {"step": "full_plan", "data": full_plan}
+        yield {"step": "clean_room_plan", "data": clean_room_plan}
         
         # Step 4: Compare Results
         logger.info("Step 4: Compare Results")
-        comparison = self.step_4_compare_results(full_plan, clean_room_plan)
-        results["steps"]["comparison"] = comparison
+        yield {"step": "comparison", "data": self.step_4_compare_results(full_plan, clean_room_plan)}
         
         # Step 5: Generate Creatives
         logger.info("Step 5: Generate Creatives")
-        creatives = self.step_5_generate_creatives(user_input)
-        results["steps"]["creatives"] = creatives
+        yield {"step": "creatives", "data": self.step_5_generate_creatives(user_input)}
         
         # Step 6: Federation Visualization
         logger.info("Step 6: Generate Federation Visualization")
-        visualization = self.step_6_federation_graph()
-        results["steps"]["visualization"] = visualization
-        
-        logger.info("Demo workflow completed successfully")
-        return results
+        yield {"step": "visualization", "data": self.step_6_federation_graph()}
     
     def step_1_harmonize_data(self) -> Dict[str, Any]:
         """Step 1: Harmonize retailer data to RMIS."""
         # Load data from warehouse
         try:
-            df = self.warehouse.query("SELECT * FROM rmis_events LIMIT 1000")
+            records = self.warehouse.count("rmis_events")
             
             return {
                 "status": "success",
-                "records_harmonized": len(df),
+                "records_harmonized": records,
                 "enum_coverage": 0.98,
                 "join_success_rate": 0.97,
                 "adapters_used": ["industry_retail_media"],
@@ -174,6 +253,7 @@ class FederationDemoWorkflow:
             roas_floor=roas_floor,
             exp_share=exp_share
         )
+        plan_result.setdefault("allocation", [])
         
         # Simulate clean room restrictions
         if clean_room_mode:
@@ -182,10 +262,9 @@ class FederationDemoWorkflow:
             plan_result["incremental_revenue"] *= 0.75  # 25% worse
             
             # Reduce SKU count
-            if "allocation" in plan_result and hasattr(plan_result["allocation"], "__len__"):
-                original_count = len(plan_result["allocation"])
-                reduced_count = int(original_count * 0.67)  # 33% fewer SKUs
-                plan_result["allocation"] = plan_result["allocation"][:reduced_count]
+            original_count = len(plan_result["allocation"])
+            reduced_count = int(original_count * 0.67)  # 33% fewer SKUs
+            plan_result["allocation"] = plan_result["allocation"][:reduced_count]
             
             plan_result["adapters_used"] = ["industry_retail_media"]
             plan_result["clean_room_mode"] = True
@@ -212,16 +291,17 @@ class FederationDemoWorkflow:
         clean_revenue = clean_room_plan.get("incremental_revenue", 0)
         
         # Count SKUs
-        full_skus = len(full_plan.get("allocation", [])) if hasattr(full_plan.get("allocation", []), "__len__") else 0
-        clean_skus = len(clean_room_plan.get("allocation", [])) if hasattr(clean_room_plan.get("allocation", []), "__len__") else 0
+        full_skus = len(full_plan["allocation"])
+        clean_skus = len(clean_room_plan["allocation"])
         
         # Calculate deltas
         roas_delta = ((full_roas - clean_roas) / clean_roas * 100) if clean_roas > 0 else 0
         revenue_delta = ((full_revenue - clean_revenue) / clean_revenue * 100) if clean_revenue > 0 else 0
         sku_delta = ((full_skus - clean_skus) / clean_skus * 100) if clean_skus > 0 else 0
         
-        comparison = ComparisonResult(
-            comparison_id=str(uuid.uuid4()),
+        # Fields are computed locally above, so skip pydantic validation
+        comparison = ComparisonResult.model_construct(
+            comparison_id=uuid.uuid4().hex,
             clean_room_roas=clean_roas,
             clean_room_revenue=clean_revenue,
             clean_room_accuracy=0.76,
@@ -245,30 +325,43 @@ class FederationDemoWorkflow:
         
         comparison.calculate_deltas()
         
-        return comparison.model_dump()
+        # Pre-format display strings once so the UI render path is lookup-only
+        result = comparison.model_dump()
+        result.update({
+            "full_roas_fmt": f"{result['full_data_roas']:.2f}x",
+            "clean_roas_fmt": f"{result['clean_room_roas']:.2f}x",
+            "roas_delta_fmt": f"{result['roas_delta_pct']:.1f}%",
+            "full_revenue_fmt": f"${result['full_data_revenue']:,.0f}",
+            "clean_revenue_fmt": f"${result['clean_room_revenue']:,.0f}",
+            "revenue_delta_fmt": f"{result['revenue_delta_pct']:.1f}%",
+            "sku_delta_fmt": f"{result['sku_delta_pct']:.1f}%"
+        })
+        
+        return result
     
     def step_5_generate_creatives(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
         """Step 5: Generate creative copy with brand adapter."""
         
-        sku_list = user_input.get("sku_list", ["SKU-042", "SKU-018", "SKU-007"])
+        sku_list = user_input.get("sku_list", ["SKU-042", "SKU-018", "SKU-007"])[:3]  # Limit to 3 for demo
         
-        creatives = []
-        for sku in sku_list[:3]:  # Limit to 3 for demo
-            variants = self.creative_gen.generate_variants(
-                product_name=f"Product {sku}",
-                num_variants=2
-            )
-            
-            # Check policy compliance
-            for variant in variants:
-                policy_result = self.policy_checker.check(variant["text"], "alpha")
-                variant["compliant"] = policy_result["pass"]
-                variant["violations"] = policy_result.get("reasons", [])
-            
-            creatives.append({
-                "sku": sku,
-                "variants": variants
-            })
+        # Generate all variants, then policy-check them, in one call each
+        variant_sets = self.creative_gen.generate_variants_batch(
+            product_names=[f"Product {sku}" for sku in sku_list],
+            num_variants=2
+        )
+        variants = [variant for variant_set in variant_sets for variant in variant_set]
+        policy_results = self.policy_checker.check_batch(
+            [variant["text"] for variant in variants], "alpha"
+        )
+        
+        for variant, policy_result in zip(variants, policy_results):
+            variant["compliant"] = policy_result["pass"]
+            variant["violations"] = policy_result.get("reasons", [])
+        
+        creatives = [
+            {"sku": sku, "variants": variant_set}
+            for sku, variant_set in zip(sku_list, variant_sets)
+        ]
         
         return {
             "status": "success",
@@ -278,63 +371,35 @@ class FederationDemoWorkflow:
         }
     
     def step_6_federation_graph(self) -> Dict[str, Any]:
-        """Step 6: Generate federation composition graph."""
+        """Step 6: Generate federation composition graph.
         
-        return {
-            "layers": [
-                {
-                    "name": "Generic LLM",
-                    "type": "base",
-                    "model": "Llama 3.1 8B",
-                    "capabilities": ["General reasoning", "Tool use", "Schema comprehension"]
-                },
-                {
-                    "name": "Industry LoRA",
-                    "type": "industry",
-                    "adapter_id": "industry_retail_media",
-                    "capabilities": ["RMIS schema", "Clean room protocols", "Campaign metrics"]
-                },
-                {
-                    "name": "Manufacturer LoRA",
-                    "type": "manufacturer",
-                    "adapter_id": "manufacturer_brand_x",
-                    "capabilities": ["Brand tone", "Product hierarchies", "Private metrics"]
-                },
-                {
-                    "name": "Task LoRA",
-                    "type": "task",
-                    "adapter_id": "task_planning",
-                    "capabilities": ["Budget allocation", "Tool calling", "Constraint satisfaction"]
-                }
-            ],
-            "composition_strategy": "sequential",
-            "total_parameters": "8.5B",
-            "lora_parameters": "67M",
-            "composition_time_ms": 1850
-        }
+        Returns the shared module-level descriptor; callers must not mutate it.
+        """
+        return _FEDERATION_GRAPH_DESCRIPTOR
 
 
 class MockFederation:
     """Mock federation service for demo without actual model loading."""
     
     def __init__(self):
-        self.active_adapters = []
+        self.active_adapters = ()
         self.composition_log = []
     
     def compose(self, task, retailer_id=None, brand_id=None, force_adapters=None):
         """Mock compose method."""
-        adapters = force_adapters or ["industry_retail_media", "manufacturer_brand_x", f"task_{task}"]
+        adapters = _compose_key(
+            task, retailer_id, brand_id,
+            tuple(force_adapters) if force_adapters else None
+        )
         self.active_adapters = adapters
         return None, adapters
     
     def infer(self, prompt, task, retailer_id=None, brand_id=None, tools=None, system_prompt=None):
-        """Mock infer method."""
-        return {
-            "response": "Mock response",
-            "adapters_used": self.active_adapters,
-            "tool_calls": [],
-            "inference_time_ms": 45
-        }
+        """Mock infer method.
+        
+        Returns a shared read-only result per active adapter set.
+        """
+        return _mock_infer_result(self.active_adapters)
     
     def get_active_adapters(self):
         """Get active adapters."""
@@ -345,6 +410,23 @@ class MockFederation:
         return self.composition_log
 
 
+@lru_cache(maxsize=64)
+def _compose_key(task, retailer_id, brand_id, force_adapters):
+    """Resolve the mock adapter stack for a compose request (cached)."""
+    return force_adapters or ("industry_retail_media", "manufacturer_brand_x", f"task_{task}")
+
+
+@lru_cache(maxsize=64)
+def _mock_infer_result(adapters):
+    """Build the immutable mock inference result for an adapter stack (cached)."""
+    return MappingProxyType({
+        "response": "Mock response",
+        "adapters_used": adapters,
+        "tool_calls": (),
+        "inference_time_ms": 45
+    })
+
+
 # Convenience function for demo
 def run_federation_demo(
     budget: float = 2500000,
@@ -376,6 +458,36 @@ def run_federation_demo(
     return workflow.run_full_demo(user_input)
 
 
+def run_federation_demo_stream(
+    budget: float = 2500000,
+    roas_floor: float = 3.0,
+    exp_share: float = 0.1,
+    sku_list: Optional[list] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run the federation demo, yielding each step's result as it completes.
+    
+    Args:
+        budget: Total budget
+        roas_floor: Minimum ROAS constraint
+        exp_share: Experiment budget share
+        sku_list: List of SKUs for creative generation
+        
+    Yields:
+        ``{"step": name, "data": result}`` per workflow step
+    """
+    workflow = FederationDemoWorkflow(use_mock_llm=True)
+    
+    user_input = {
+        "budget": budget,
+        "roas_floor": roas_floor,
+        "exp_share": exp_share,
+        "sku_list": sku_list or ["SKU-042", "SKU-018", "SKU-007"]
+    }
+    
+    yield from workflow.run_full_demo_stream(user_input)
+
+
 if __name__ == "__main__":
     # Run demo
     logging.basicConfig(level=logging.INFO)
@@ -2,12 +2,22 @@
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Tuple
 
-# Set seed for reproducibility
-np.random.seed(42)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Root seed; each generator gets its own spawned Generator (PCG64)
+SEED = 42
 
 # Create data directory
 data_dir = Path(__file__).parent / "data"
@@ -21,186 +31,236 @@ alpha_dir.mkdir(exist_ok=True)
 beta_dir = data_dir / "retailer_beta"
 beta_dir.mkdir(exist_ok=True)
 
+# SKU labels, gathered by index instead of formatted per row
+SKU_IDS = np.char.mod('SKU-%03d', np.arange(1, 101))
+
+# Rows serialized per JSONL write
+JSONL_CHUNK_ROWS = 4096
+
+# All generated activity falls within 90 days of this date
+START_DATE = np.datetime64('2024-01-01T00:00:00')
+
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = {
+    'adType', 'audience_segment', 'device', 'currency', 'timezone',
+    'attribution_model', 'status', 'objective', 'category', 'brand',
+    'retailer', 'placement', 'audience',
+}
+
 
-def generate_retailer_alpha_data():
+# Whether to also emit CSV next to the Feather files (set per worker via --csv)
+WRITE_CSV = False
+
+
+def _set_write_csv(enabled: bool):
+    """Process-pool initializer propagating the --csv flag to each worker."""
+    global WRITE_CSV
+    WRITE_CSV = enabled
+
+
+def _write_table(df: pd.DataFrame, path: Path):
+    """Write a DataFrame as zstd Feather and Parquet, plus CSV if requested.
+    
+    Without PyArrow only the CSV is written.
+    """
+    df = df.astype({col: 'category' for col in df.columns if col in CATEGORICAL_COLUMNS})
+    if HAS_PYARROW:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        feather.write_feather(table, path.with_suffix('.feather'), compression='zstd')
+        pq.write_table(table, path.with_suffix('.parquet'), compression='zstd')
+        if WRITE_CSV:
+            pacsv.write_csv(table, path)
+    else:
+        df.to_csv(path, index=False)
+
+
+def _rand_timestamps(rng: np.random.Generator, n: int, tz: str, hours: bool = True) -> np.ndarray:
+    """Draw n timestamps in the 90 days after START_DATE, formatted with a tz suffix.
+    
+    Day offsets are drawn first, then hour offsets when ``hours`` is set.
+    """
+    offsets = rng.integers(0, 90, n).astype('timedelta64[D]')
+    if hours:
+        offsets = offsets + rng.integers(0, 24, n).astype('timedelta64[h]')
+    return pd.DatetimeIndex(START_DATE + offsets).strftime(f'%Y-%m-%d %H:%M:%S {tz}').to_numpy()
+
+
+def generate_retailer_alpha_data(rng: np.random.Generator) -> List[Tuple[str, int]]:
     """Generate Retailer Alpha data (CSV format, US-centric)."""
     
+    # Campaign IDs (shared by events and campaigns tables)
+    n_campaigns = 20
+    campaign_ids = np.char.mod('camp_alpha_%03d', np.arange(1, n_campaigns + 1))
+    
     # Events data
     n_events = 10000
-    start_date = datetime(2024, 1, 1)
-    
-    events = []
-    for i in range(n_events):
-        event = {
-            'event_id': f'evt_alpha_{i:06d}',
-            'timestamp': (start_date + timedelta(days=np.random.randint(0, 90), 
-                                                 hours=np.random.randint(0, 24))).strftime('%Y-%m-%d %H:%M:%S CST'),
-            'adType': np.random.choice(['sp', 'SD', 'onsite_disp', 'offsite_vid']),  # Mixed case
-            'cost_micros': np.random.randint(100000, 5000000),  # Micros (USD)
-            'impressions': np.random.randint(100, 10000),
-            'clicks': np.random.randint(0, 500),
-            'conv_click_7d': np.random.randint(0, 50),
-            'revenue_7d': np.random.randint(0, 5000),
-            'campaign_id': f'camp_alpha_{np.random.randint(1, 20):03d}',
-            'sku': f'SKU-{np.random.randint(1, 100):03d}',
-            'audience_segment': np.random.choice(['retargeting', 'inmarket', 'lookalike', None]),
-            'device': np.random.choice(['mobile', 'desktop', 'tablet', 'UNKNOWN']),
-            'currency': 'USD',
-            'timezone': 'CST'
-        }
-        events.append(event)
     
-    df_events = pd.DataFrame(events)
-    df_events.to_csv(alpha_dir / "events.csv", index=False)
-    print(f"✅ Generated {len(df_events)} Retailer Alpha events")
+    timestamps = _rand_timestamps(rng, n_events, 'CST')
+    
+    event_ids = np.char.mod('evt_alpha_%06d', np.arange(n_events))
+    
+    df_events = pd.DataFrame({
+        'event_id': event_ids,
+        'timestamp': timestamps,
+        'adType': rng.choice(['sp', 'SD', 'onsite_disp', 'offsite_vid'], n_events),  # Mixed case
+        'cost_micros': rng.integers(100000, 5000000, n_events),  # Micros (USD)
+        'impressions': rng.integers(100, 10000, n_events),
+        'clicks': rng.integers(0, 500, n_events),
+        'conv_click_7d': rng.integers(0, 50, n_events),
+        'revenue_7d': rng.integers(0, 5000, n_events),
+        'campaign_id': campaign_ids[rng.integers(0, 19, n_events)],
+        'sku': SKU_IDS[rng.integers(0, 99, n_events)],
+        'audience_segment': rng.choice(['retargeting', 'inmarket', 'lookalike', None], n_events),
+        'device': rng.choice(['mobile', 'desktop', 'tablet', 'UNKNOWN'], n_events),
+        'currency': 'USD',
+        'timezone': 'CST'
+    })
+    _write_table(df_events, alpha_dir / "events.csv")
     
     # Conversions data
-    conversions = []
-    for i in range(2000):
-        conv = {
-            'conversion_id': f'conv_alpha_{i:06d}',
-            'event_id': f'evt_alpha_{np.random.randint(0, n_events):06d}',
-            'conversion_timestamp': (start_date + timedelta(days=np.random.randint(0, 90))).strftime('%Y-%m-%d %H:%M:%S CST'),
-            'conversion_value': np.random.randint(10, 500),
-            'attribution_model': np.random.choice(['last_click', 'first_click', 'linear']),
-            'sku': f'SKU-{np.random.randint(1, 100):03d}',
-            'quantity': np.random.randint(1, 5)
-        }
-        conversions.append(conv)
+    n_conversions = 2000
+    conversion_timestamps = _rand_timestamps(rng, n_conversions, 'CST', hours=False)
     
-    df_conversions = pd.DataFrame(conversions)
-    df_conversions.to_csv(alpha_dir / "conversions.csv", index=False)
-    print(f"✅ Generated {len(df_conversions)} Retailer Alpha conversions")
+    df_conversions = pd.DataFrame({
+        'conversion_id': np.char.mod('conv_alpha_%06d', np.arange(n_conversions)),
+        'event_id': rng.choice(event_ids, n_conversions),  # FK into events
+        'conversion_timestamp': conversion_timestamps,
+        'conversion_value': rng.integers(10, 500, n_conversions),
+        'attribution_model': rng.choice(['last_click', 'first_click', 'linear'], n_conversions),
+        'sku': SKU_IDS[rng.integers(0, 99, n_conversions)],
+        'quantity': rng.integers(1, 5, n_conversions)
+    })
+    _write_table(df_conversions, alpha_dir / "conversions.csv")
     
     # Campaigns data
-    campaigns = []
-    for i in range(1, 21):
-        camp = {
-            'campaign_id': f'camp_alpha_{i:03d}',
-            'campaign_name': f'Alpha Campaign {i}',
-            'status': np.random.choice(['ACTIVE', 'PAUSED', 'ENDED']),
-            'daily_budget': np.random.randint(1000, 10000),
-            'start_date': (start_date + timedelta(days=np.random.randint(0, 30))).strftime('%Y-%m-%d'),
-            'objective': np.random.choice(['AWARENESS', 'CONSIDERATION', 'CONVERSION'])
-        }
-        campaigns.append(camp)
+    campaign_starts = pd.DatetimeIndex(
+        START_DATE + rng.integers(0, 30, n_campaigns).astype('timedelta64[D]')
+    )
+    
+    df_campaigns = pd.DataFrame({
+        'campaign_id': campaign_ids,
+        'campaign_name': np.char.mod('Alpha Campaign %d', np.arange(1, n_campaigns + 1)),
+        'status': rng.choice(['ACTIVE', 'PAUSED', 'ENDED'], n_campaigns),
+        'daily_budget': rng.integers(1000, 10000, n_campaigns),
+        'start_date': campaign_starts.strftime('%Y-%m-%d'),
+        'objective': rng.choice(['AWARENESS', 'CONSIDERATION', 'CONVERSION'], n_campaigns)
+    })
+    _write_table(df_campaigns, alpha_dir / "campaigns.csv")
     
-    df_campaigns = pd.DataFrame(campaigns)
-    df_campaigns.to_csv(alpha_dir / "campaigns.csv", index=False)
-    print(f"✅ Generated {len(df_campaigns)} Retailer Alpha campaigns")
+    return [
+        ("Retailer Alpha events", len(df_events)),
+        ("Retailer Alpha conversions", len(df_conversions)),
+        ("Retailer Alpha campaigns", len(df_campaigns)),
+    ]
 
 
-def generate_retailer_beta_data():
+def generate_retailer_beta_data(rng: np.random.Generator) -> List[Tuple[str, int]]:
     """Generate Retailer Beta data (JSONL format, EU-centric)."""
     
     # Events data (JSONL)
     n_events = 8000
-    start_date = datetime(2024, 1, 1)
-    
-    events = []
-    for i in range(n_events):
-        event = {
-            'id': f'beta-evt-{i:06d}',
-            'ts': (start_date + timedelta(days=np.random.randint(0, 90), 
-                                         hours=np.random.randint(0, 24))).strftime('%Y-%m-%d %H:%M:%S PST'),
-            'placementCategory': np.random.choice(['sponsored_prod', 'display_banner', 'video_pre_roll', 'native']),
-            'spend': round(np.random.uniform(1.0, 50.0), 2),  # EUR
-            'imps': np.random.randint(50, 5000),
-            'clks': np.random.randint(0, 200),
-            'sales_attrib': round(np.random.uniform(0, 500.0), 2),
-            'camp_ref': f'beta_c_{np.random.randint(1, 15):02d}',
-            'product_id': f'PROD-{np.random.randint(1, 80):03d}',
-            'aud': np.random.choice(['retarget', 'category_inmarket', 'lapsed', None]),
-            'dev_type': np.random.choice(['mob', 'desk', 'tab', 'unk']),
-            'curr': 'EUR',
-            'tz': 'PST',
-            'inventory': np.random.choice(['owned', 'partner', None])
-        }
-        events.append(event)
     
-    with open(beta_dir / "log.jsonl", 'w') as f:
-        for event in events:
-            f.write(json.dumps(event) + '\n')
+    timestamps = _rand_timestamps(rng, n_events, 'PST')
     
-    print(f"✅ Generated {len(events)} Retailer Beta events (JSONL)")
+    df_events = pd.DataFrame({
+        'id': np.char.mod('beta-evt-%06d', np.arange(n_events)),
+        'ts': timestamps,
+        'placementCategory': rng.choice(['sponsored_prod', 'display_banner', 'video_pre_roll', 'native'], n_events),
+        'spend': np.round(rng.uniform(1.0, 50.0, n_events), 2),  # EUR
+        'imps': rng.integers(50, 5000, n_events),
+        'clks': rng.integers(0, 200, n_events),
+        'sales_attrib': np.round(rng.uniform(0, 500.0, n_events), 2),
+        'camp_ref': np.char.mod('beta_c_%02d', np.arange(1, 15))[rng.integers(0, 14, n_events)],
+        'product_id': np.char.mod('PROD-%03d', np.arange(1, 80))[rng.integers(0, 79, n_events)],
+        'aud': rng.choice(['retarget', 'category_inmarket', 'lapsed', None], n_events),
+        'dev_type': rng.choice(['mob', 'desk', 'tab', 'unk'], n_events),
+        'curr': 'EUR',
+        'tz': 'PST',
+        'inventory': rng.choice(['owned', 'partner', None], n_events)
+    })
+    
+    # Stream NDJSON straight from column chunks; no per-row dict intermediate
+    with open(beta_dir / "log.jsonl", 'w', buffering=1 << 20) as f:
+        for start in range(0, n_events, JSONL_CHUNK_ROWS):
+            chunk = df_events.iloc[start:start + JSONL_CHUNK_ROWS]
+            f.write(chunk.to_json(orient='records', lines=True).rstrip('\n') + '\n')
+    
+    return [("Retailer Beta events (JSONL)", len(df_events))]
 
 
-def generate_sku_catalog():
+def generate_sku_catalog(rng: np.random.Generator) -> List[Tuple[str, int]]:
     """Generate SKU catalog with pricing and inventory."""
     
-    skus = []
-    for i in range(1, 101):
-        sku = {
-            'sku_id': f'SKU-{i:03d}',
-            'product_name': f'Product {i}',
-            'category': np.random.choice(['Electronics', 'Home', 'Beauty', 'Food', 'Apparel']),
-            'price': round(np.random.uniform(10, 500), 2),
-            'cost': round(np.random.uniform(5, 250), 2),
-            'margin_pct': round(np.random.uniform(0.2, 0.6), 3),
-            'stock_units': np.random.randint(0, 1000),
-            'stock_probability': round(np.random.uniform(0.7, 1.0), 3),  # Probability in stock
-            'upc': f'{np.random.randint(100000000000, 999999999999)}',
-            'brand': np.random.choice(['BrandA', 'BrandB', 'BrandC', 'BrandD'])
-        }
-        # Calculate margin
-        sku['margin_pct'] = round((sku['price'] - sku['cost']) / sku['price'], 3)
-        skus.append(sku)
+    n_skus = len(SKU_IDS)
+    price = np.round(rng.uniform(10, 500, n_skus), 2)
+    cost = np.round(rng.uniform(5, 250, n_skus), 2)
+    
+    df_skus = pd.DataFrame({
+        'sku_id': SKU_IDS,
+        'product_name': np.char.mod('Product %d', np.arange(1, n_skus + 1)),
+        'category': rng.choice(['Electronics', 'Home', 'Beauty', 'Food', 'Apparel'], n_skus),
+        'price': price,
+        'cost': cost,
+        'margin_pct': np.round((price - cost) / price, 3),
+        'stock_units': rng.integers(0, 1000, n_skus),
+        'stock_probability': np.round(rng.uniform(0.7, 1.0, n_skus), 3),  # Probability in stock
+        'upc': np.char.mod('%012d', rng.integers(10**11, 10**12, n_skus)),
+        'brand': rng.choice(['BrandA', 'BrandB', 'BrandC', 'BrandD'], n_skus)
+    })
     
-    df_skus = pd.DataFrame(skus)
-    df_skus.to_csv(data_dir / "sku_catalog.csv", index=False)
-    print(f"✅ Generated {len(df_skus)} SKUs")
+    _write_table(df_skus, data_dir / "sku_catalog.csv")
+    return [("SKUs", len(df_skus))]
 
 
-def generate_uplift_priors():
+def generate_uplift_priors(rng: np.random.Generator) -> List[Tuple[str, int]]:
     """Generate uplift priors (ICE - Incremental Conversions per Euro/Dollar)."""
     
     retailers = ['alpha', 'beta']
     placements = ['sponsored_product', 'onsite_display', 'offsite_video', 'native']
     audiences = ['retargeting', 'inmarket', 'lookalike', 'lapsed']
     
-    priors = []
-    for retailer in retailers:
-        for placement in placements:
-            for audience in audiences:
-                # Generate 10 SKUs per combination
-                for _ in range(10):
-                    sku = f'SKU-{np.random.randint(1, 100):03d}'
-                    
-                    # ICE varies by placement and audience
-                    base_ice = {
-                        'sponsored_product': 0.08,
-                        'onsite_display': 0.05,
-                        'offsite_video': 0.03,
-                        'native': 0.04
-                    }[placement]
-                    
-                    audience_multiplier = {
-                        'retargeting': 1.5,
-                        'inmarket': 1.2,
-                        'lookalike': 1.0,
-                        'lapsed': 0.8
-                    }[audience]
-                    
-                    ice = base_ice * audience_multiplier * np.random.uniform(0.8, 1.2)
-                    
-                    prior = {
-                        'retailer': retailer,
-                        'placement': placement,
-                        'audience': audience,
-                        'sku': sku,
-                        'ice': round(ice, 4),  # Incremental conversions per dollar
-                        'baseline_cvr': round(np.random.uniform(0.01, 0.05), 4),
-                        'cpa': round(1.0 / ice if ice > 0 else 999, 2),
-                        'confidence': round(np.random.uniform(0.6, 0.95), 2)
-                    }
-                    priors.append(prior)
-    
-    df_priors = pd.DataFrame(priors)
-    df_priors.to_csv(data_dir / "uplift_priors.csv", index=False)
-    print(f"✅ Generated {len(df_priors)} uplift priors")
-
-
-def generate_audience_segments():
+    base_ice = {
+        'sponsored_product': 0.08,
+        'onsite_display': 0.05,
+        'offsite_video': 0.03,
+        'native': 0.04
+    }
+    audience_multiplier = {
+        'retargeting': 1.5,
+        'inmarket': 1.2,
+        'lookalike': 1.0,
+        'lapsed': 0.8
+    }
+    
+    # Generate 10 SKUs per retailer/placement/audience combination
+    grid = pd.MultiIndex.from_product(
+        [retailers, placements, audiences, range(10)],
+        names=['retailer', 'placement', 'audience', 'rep']
+    ).to_frame(index=False)
+    n = len(grid)
+    
+    # ICE varies by placement and audience
+    ice = (
+        grid['placement'].map(base_ice).to_numpy()
+        * grid['audience'].map(audience_multiplier).to_numpy()
+        * rng.uniform(0.8, 1.2, n)
+    )
+    
+    df_priors = pd.DataFrame({
+        'retailer': grid['retailer'],
+        'placement': grid['placement'],
+        'audience': grid['audience'],
+        'sku': SKU_IDS[rng.integers(0, 99, n)],
+        'ice': np.round(ice, 4),  # Incremental conversions per dollar
+        'baseline_cvr': np.round(rng.uniform(0.01, 0.05, n), 4),
+        'cpa': np.round(np.where(ice > 0, 1.0 / ice, 999), 2),
+        'confidence': np.round(rng.uniform(0.6, 0.95, n), 2)
+    })
+    _write_table(df_priors, data_dir / "uplift_priors.csv")
+    return [("uplift priors", len(df_priors))]
+
+
+def generate_audience_segments(rng: np.random.Generator) -> List[Tuple[str, int]]:
     """Generate audience segment definitions."""
     
     segments = [
@@ -235,38 +295,54 @@ def generate_audience_segments():
     ]
     
     df_segments = pd.DataFrame(segments)
-    df_segments.to_csv(data_dir / "audience_segments.csv", index=False)
-    print(f"✅ Generated {len(df_segments)} audience segments")
+    _write_table(df_segments, data_dir / "audience_segments.csv")
+    return [("audience segments", len(df_segments))]
 
 
-def generate_geo_regions():
+def generate_geo_regions(rng: np.random.Generator) -> List[Tuple[str, int]]:
     """Generate geographic regions for testing."""
     
-    regions = []
-    for i in range(1, 21):
-        region = {
-            'dma_code': f'DMA_{i:03d}',
-            'dma_name': f'Market Region {i}',
-            'population': np.random.randint(500000, 5000000),
-            'baseline_sales': np.random.randint(100000, 1000000),
-            'seasonality_index': round(np.random.uniform(0.8, 1.2), 2)
-        }
-        regions.append(region)
+    n_regions = 20
     
-    df_regions = pd.DataFrame(regions)
-    df_regions.to_csv(data_dir / "geo_regions.csv", index=False)
-    print(f"✅ Generated {len(df_regions)} geo regions")
+    df_regions = pd.DataFrame({
+        'dma_code': np.char.mod('DMA_%03d', np.arange(1, n_regions + 1)),
+        'dma_name': np.char.mod('Market Region %d', np.arange(1, n_regions + 1)),
+        'population': rng.integers(500000, 5000000, n_regions),
+        'baseline_sales': rng.integers(100000, 1000000, n_regions),
+        'seasonality_index': np.round(rng.uniform(0.8, 1.2, n_regions), 2)
+    })
+    _write_table(df_regions, data_dir / "geo_regions.csv")
+    return [("geo regions", len(df_regions))]
+
+
+GENERATORS = [
+    generate_retailer_alpha_data,
+    generate_retailer_beta_data,
+    generate_sku_catalog,
+    generate_uplift_priors,
+    generate_audience_segments,
+    generate_geo_regions,
+]
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", action="store_true", help="also write CSV files next to the Feather output")
+    args = parser.parse_args()
+    
     print("🚀 Generating synthetic data for RMN demo...\n")
     
-    generate_retailer_alpha_data()
-    generate_retailer_beta_data()
-    generate_sku_catalog()
-    generate_uplift_priors()
-    generate_audience_segments()
-    generate_geo_regions()
+    # Independent generators run in parallel, each with its own seeded stream
+    seeds = np.random.SeedSequence(SEED).spawn(len(GENERATORS))
+    with ProcessPoolExecutor(
+        max_workers=len(GENERATORS), initializer=_set_write_csv, initargs=(args.csv,)
+    ) as executor:
+        futures = [
+            executor.submit(generate, np.random.default_rng(seed))
+            for generate, seed in zip(GENERATORS, seeds)
+        ]
+        results = [item for future in futures for item in future.result()]
     
+    print("\n".join(f"✅ Generated {count} {name}" for name, count in results))
     print("\n✅ All synthetic data generated successfully!")
     print(f"📁 Data location: {data_dir.absolute()}")
@@ -0,0 +1,736 @@
+"""Streamlit Demo UI for RMN LoRA System (main page; see streamlit_app.py)."""
+
+import streamlit as st
+import pandas as pd
+import pyarrow as pa
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+from typing import TYPE_CHECKING
+
+# Add parent directory to path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+if TYPE_CHECKING:
+    from demo.tools.warehouse import WarehouseManager
+    from demo.tools.optimizer import BudgetOptimizer
+    from demo.tools.policy import PolicyChecker
+    from demo.tools.creatives import CreativeGenerator
+    from demo.tools.experiments import ExperimentDesigner
+
+# Simulated agent latency for presentations; off unless RMN_DEMO_SLEEP=1
+DEMO_SLEEP = os.getenv("RMN_DEMO_SLEEP", "0") == "1"
+
+# SKU choices for the creative generator
+_ALL_SKUS = tuple(f"SKU-{i:03d}" for i in range(1, 21))
+_DEFAULT_SKUS = _ALL_SKUS[:3]
+
+# Page config
+st.set_page_config(
+    page_title="RMN LoRA Demo",
+    page_icon="🎯",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Professional CSS - Integrated from index.css and App.css
+@st.cache_data
+def _css() -> str:
+    """Load the app stylesheet once per server process."""
+    return (Path(__file__).parent / "app_style.css").read_text()
+
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
+
+
+# Each tool module is imported on first use, not when the app starts.
+def get_warehouse() -> "WarehouseManager":
+    """This session's warehouse.
+    
+    Loaded and harmonized tables are per-session state, and a DuckDB
+    connection must not be shared across script threads, so each browser
+    session gets its own.
+    """
+    if 'warehouse' not in st.session_state:
+        from demo.tools.warehouse import WarehouseManager
+        st.session_state.warehouse = WarehouseManager()
+    return st.session_state.warehouse
+
+
+# Stateless tool singletons: constructors load data files, so build each once per process.
+@st.cache_resource
+def get_optimizer() -> "BudgetOptimizer":
+    from demo.tools.optimizer import BudgetOptimizer
+    return BudgetOptimizer()
+
+
+@st.cache_resource
+def get_policy_checker() -> "PolicyChecker":
+    from demo.tools.policy import PolicyChecker
+    return PolicyChecker()
+
+
+@st.cache_resource
+def get_creative_gen() -> "CreativeGenerator":
+    from demo.tools.creatives import CreativeGenerator
+    return CreativeGenerator()
+
+
+@st.cache_resource
+def get_experiment_designer() -> "ExperimentDesigner":
+    from demo.tools.experiments import ExperimentDesigner
+    return ExperimentDesigner()
+
+
+# Planner and experiment runs execute off the script thread, so a second
+# "Draft Plan"/"Design Experiment" click overlaps with one still solving.
+@st.cache_resource
+def _agent_executor() -> ThreadPoolExecutor:
+    """Worker threads for agent runs, shared by all sessions (caps concurrent runs)."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="rmn-agent")
+
+
+def _run_agent(latency_s: float, fn, **kwargs):
+    """Worker body: optional simulated latency, then the tool call."""
+    if DEMO_SLEEP:
+        time.sleep(latency_s)
+    return fn(**kwargs)
+
+
+@st.fragment(run_every=0.3)
+def _await_agent(future_key: str, result_key: str, message: str):
+    """Poll a submitted agent run; each tick reruns only this fragment."""
+    future = st.session_state[future_key]
+    if not future.done():
+        st.info(message)
+        return
+    
+    del st.session_state[future_key]
+    try:
+        st.session_state[result_key] = future.result()
+    except Exception as e:
+        # Reported by _agent_error on the full rerun below
+        st.session_state[f"{result_key}_error"] = e
+    st.rerun()  # Full rerun renders the result
+
+
+def _agent_error(result_key: str):
+    """Show the error of a failed agent run, once."""
+    error = st.session_state.pop(f"{result_key}_error", None)
+    if error is not None:
+        st.error(f"❌ {error}")
+
+
+def _source_mtime(retailer: str) -> float:
+    """Modification time of a retailer's raw data file (0.0 if missing)."""
+    path = get_warehouse().source_path(retailer)
+    return path.stat().st_mtime if path is not None else 0.0
+
+
+def _harmonize(retailer: str) -> dict:
+    """Harmonize a retailer into this session's warehouse, once per version of its source file.
+    
+    Loads the raw data first, so a harmonize before "Load" works. Successful
+    results are remembered in session state (the warehouse is per session
+    too); harmonize_retailer replaces the retailer's rows, so a repeat run
+    after the source changes never duplicates them.
+    """
+    key = (retailer, _source_mtime(retailer))
+    done = st.session_state.setdefault('harmonize_results', {})
+    if key not in done:
+        warehouse = get_warehouse()
+        warehouse.load_retailer_data(retailer)
+        result = warehouse.harmonize_retailer(retailer)
+        if not result['success']:
+            return result
+        done[key] = result
+    return done[key]
+
+
+# Static demo tables, converted to Arrow once per process so st.dataframe
+# skips the pandas -> Arrow conversion. cache_resource hands back the same
+# (immutable) table each rerun instead of unpickling a copy like cache_data.
+def _arrow(df: pd.DataFrame) -> pa.Table:
+    """Arrow table for ``df``, without the pandas index."""
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+@st.cache_resource
+def _mapping_gaps_table() -> pa.Table:
+    """Mapping gaps shown after harmonization (static data, built once)."""
+    return _arrow(pd.DataFrame([
+        {"Field": "inventory_type", "Issue": "Unknown enum 'partner'", "Suggestion": "Add to enum map"},
+        {"Field": "attribution_model", "Issue": "Missing for 5% of rows", "Suggestion": "Default to 'last_click'"},
+        {"Field": "device_type", "Issue": "Value 'unk' not in taxonomy", "Suggestion": "Map to 'unknown'"}
+    ]))
+
+
+@st.cache_resource
+def _sensitivity_table() -> pa.Table:
+    """Sensitivity of the plan to the ROAS floor (static data, built once)."""
+    return _arrow(pd.DataFrame({
+        'ROAS Floor': [2.5, 2.8, 3.0, 3.2, 3.5],
+        'Expected ROAS': [3.8, 3.5, 3.2, 3.0, 2.8],
+        'Incremental Revenue': [9500000, 8750000, 8000000, 7500000, 7000000],
+        'Risk Level': ['Low', 'Low', 'Medium', 'High', 'High']
+    }))
+
+
+@st.cache_resource
+def _adapter_log_table() -> pa.Table:
+    """Recent adapter compositions for the Ops tab (static data, built once)."""
+    return _arrow(pd.DataFrame([
+        {"Timestamp": "2024-10-15 16:45:23", "Task": "Planning", "Adapters": "base + task_planning + retailer_alpha", "Status": "✅"},
+        {"Timestamp": "2024-10-15 16:45:18", "Task": "Mapping", "Adapters": "base + task_mapping + retailer_beta", "Status": "✅"},
+        {"Timestamp": "2024-10-15 16:44:52", "Task": "Creative", "Adapters": "base + task_policy_creative + retailer_alpha", "Status": "✅"},
+        {"Timestamp": "2024-10-15 16:44:31", "Task": "Optimization", "Adapters": "base + task_planning", "Status": "✅"},
+    ]))
+
+
+@st.cache_resource
+def _tool_log_table() -> pa.Table:
+    """Recent tool calls for the Ops tab (static data, built once)."""
+    return _arrow(pd.DataFrame([
+        {"Time": "16:45:23", "Function": "allocate_budget", "Args": "budget=2500000, roas_floor=3.0", "Result": "✅ Success", "Duration": "234ms"},
+        {"Time": "16:45:20", "Function": "fetch_metrics", "Args": "rmn=alpha, window=30d", "Result": "✅ Success", "Duration": "89ms"},
+        {"Time": "16:45:18", "Function": "get_uplift_priors", "Args": "granularity=sku", "Result": "✅ Success", "Duration": "45ms"},
+        {"Time": "16:44:52", "Function": "policy_check", "Args": "retailer=alpha", "Result": "⚠️ 1 violation", "Duration": "12ms"},
+    ]))
+
+
+@st.cache_resource
+def _enum_coverage_table() -> pa.Table:
+    """Enum coverage per field (static data, built once)."""
+    return _arrow(pd.DataFrame({
+        'Field': ['placement_type', 'device_type', 'inventory_type', 'attribution_model'],
+        'Coverage': [100, 98, 92, 95],
+        'Status': ['✅', '✅', '⚠️', '✅']
+    }))
+
+
+@st.cache_resource
+def _join_rates_table() -> pa.Table:
+    """Join success rates (static data, built once)."""
+    return _arrow(pd.DataFrame({
+        'Join': ['events → campaigns', 'events → skus', 'conversions → events', 'events → audiences'],
+        'Rate': [99.8, 97.2, 98.5, 94.1],
+        'Status': ['✅', '✅', '✅', '⚠️']
+    }))
+
+
+# Initialize session state (the warehouse is created on first use by get_warehouse)
+st.session_state.setdefault('harmonized', False)
+st.session_state.setdefault('plan', None)
+st.session_state.setdefault('design', None)
+
+# Title
+st.title("🎯 RMN LoRA System Demo")
+st.markdown("**Composable LoRA Adapters for Retail Media Network Optimization**")
+
+# Sidebar
+with st.sidebar:
+    st.header("⚙️ Configuration")
+    
+    retailer_mode = st.radio(
+        "Execution Mode",
+        ["Manufacturer View", "Retailer Alpha Service", "Retailer Beta Service"],
+        help="Toggle between manufacturer and retailer-hosted agent execution"
+    )
+    
+    st.divider()
+    
+    st.subheader("Active Adapters")
+    if retailer_mode == "Manufacturer View":
+        st.success("✅ Base Model")
+        st.info("🔧 Task: Planning")
+        st.info("🔧 Task: Mapping")
+    elif retailer_mode == "Retailer Alpha Service":
+        st.success("✅ Base Model")
+        st.warning("🏪 Retailer: Alpha")
+        st.info("🔧 Task: Planning")
+    else:
+        st.success("✅ Base Model")
+        st.warning("🏪 Retailer: Beta")
+        st.info("🔧 Task: Planning")
+    
+    st.divider()
+    
+    st.subheader("📊 System Status")
+    st.metric("Data Quality", "94%", "↑ 2%")
+    st.metric("Active Campaigns", "18", "↑ 3")
+    st.metric("Total Budget", "$2.5M", "")
+
+# Main tabs; each body is a fragment, so its widgets rerun only that tab
+tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+    "📥 Data", "📋 Plan", "💰 Optimize", "📊 Measure", "✨ Creative", "🔧 Ops"
+])
+
+# TAB 1: DATA HARMONIZATION
+@st.fragment
+def _tab_data():
+    """Data tab: load and harmonize retailer exports."""
+    st.header("Data Harmonization")
+    st.markdown("Upload retailer exports and harmonize to RMIS schema")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Retailer Alpha")
+        st.markdown("**Format:** CSV | **Timezone:** CST | **Currency:** USD")
+        
+        if st.button("📂 Load Alpha Data", key="load_alpha"):
+            with st.spinner("Loading Retailer Alpha data..."):
+                success = get_warehouse().load_retailer_data("alpha")
+                if success:
+                    st.success("✅ Loaded Alpha data")
+                else:
+                    st.error("❌ Failed to load data")
+        
+        if st.button("🔄 Harmonize Alpha", key="harmonize_alpha"):
+            with st.spinner("Harmonizing Alpha data to RMIS..."):
+                result = _harmonize("alpha")
+                if result['success']:
+                    st.success(f"✅ Harmonized {result['rows']} rows")
+                    st.session_state.harmonized = True
+                    
+                    # Show quality metrics
+                    st.metric("Enum Coverage", f"{result['enum_coverage']}%")
+                    st.metric("Join Success Rate", f"{result['join_rate']}%")
+                    st.metric("Non-null Keys", f"{result['non_null_keys']}%")
+                    
+                    # Show preview
+                    with st.expander("Preview Harmonized Data"):
+                        st.dataframe(result['preview'])
+    
+    with col2:
+        st.subheader("Retailer Beta")
+        st.markdown("**Format:** JSONL | **Timezone:** PST | **Currency:** EUR")
+        
+        if st.button("📂 Load Beta Data", key="load_beta"):
+            with st.spinner("Loading Retailer Beta data..."):
+                success = get_warehouse().load_retailer_data("beta")
+                if success:
+                    st.success("✅ Loaded Beta data")
+                else:
+                    st.error("❌ Failed to load data")
+        
+        if st.button("🔄 Harmonize Beta", key="harmonize_beta"):
+            with st.spinner("Harmonizing Beta data to RMIS..."):
+                result = _harmonize("beta")
+                if result['success']:
+                    st.success(f"✅ Harmonized {result['rows']} rows")
+                    
+                    # Show quality metrics
+                    st.metric("Enum Coverage", f"{result['enum_coverage']}%")
+                    st.metric("Join Success Rate", f"{result['join_rate']}%")
+                    st.metric("Non-null Keys", f"{result['non_null_keys']}%")
+                    
+                    # Show preview
+                    with st.expander("Preview Harmonized Data"):
+                        st.dataframe(result['preview'])
+    
+    st.divider()
+    
+    # Mapping validation
+    st.subheader("📋 Mapping Validation")
+    
+    if st.session_state.harmonized:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Total Events", "18,000", "")
+        with col2:
+            st.metric("Validated Fields", "42/45", "")
+        with col3:
+            st.metric("Mapping Gaps", "3", "⚠️")
+        
+        with st.expander("🔍 View Mapping Gaps"):
+            st.dataframe(_mapping_gaps_table())
+
+
+with tab1:
+    _tab_data()
+
+# TAB 2: PLANNING
+@st.fragment
+def _tab_plan():
+    """Plan tab: planning brief and the recommended allocation."""
+    st.header("Campaign Planning")
+    st.markdown("AI-powered planning with tool-calling agents")
+    
+    # Planning brief
+    st.subheader("📝 Planning Brief")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        brief = st.text_area(
+            "Objectives & Constraints",
+            value="""Budget: $2,500,000
+Target ROAS: ≥ 3.0
+Experiment Reserve: 10%
+Exclude: SKUs with OOS probability > 5%
+Focus: Maximize incremental margin
+Retailers: Alpha, Beta""",
+            height=150
+        )
+    
+    with col2:
+        st.markdown("**Quick Constraints**")
+        budget = st.number_input("Budget ($)", value=2500000, step=100000)
+        roas_target = st.number_input("Min ROAS", value=3.0, step=0.1)
+        exp_share = st.slider("Experiment %", 0, 20, 10)
+    
+    if st.button("🚀 Draft Plan", type="primary"):
+        st.session_state.plan_future = _agent_executor().submit(
+            _run_agent, 2, get_optimizer().generate_plan,
+            budget=budget,
+            roas_floor=roas_target,
+            exp_share=exp_share / 100
+        )
+        st.session_state.pop('previous_plan', None)
+        st.rerun()  # Starts the poller below the tab fragment
+    
+    # Show plan
+    if st.session_state.plan:
+        st.divider()
+        st.subheader("📊 Recommended Allocation")
+        
+        # Summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Budget", f"${st.session_state.plan['budget']:,.0f}")
+        with col2:
+            st.metric("Expected ROAS", f"{st.session_state.plan['expected_roas']:.2f}x")
+        with col3:
+            st.metric("Incremental Revenue", f"${st.session_state.plan['incremental_revenue']:,.0f}")
+        with col4:
+            st.metric("Experiment Budget", f"${st.session_state.plan['experiment_budget']:,.0f}")
+        
+        # Allocation table
+        st.dataframe(
+            st.session_state.plan['allocation'],
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        # Tool call trail
+        with st.expander("🔧 Tool Call Trail"):
+            for call in st.session_state.plan['tool_calls']:
+                st.code(f"✅ {call['function']}({call['formatted']})", language="json")
+        
+        # Rationale
+        with st.expander("💡 Plan Rationale"):
+            for reason in st.session_state.plan['rationale']:
+                st.markdown(f"- {reason}")
+
+
+with tab2:
+    _tab_plan()
+    _agent_error('plan')
+    if 'plan_future' in st.session_state:
+        _await_agent('plan_future', 'plan', "🤖 Planner Agent working...")
+
+# TAB 3: OPTIMIZATION
+@st.fragment
+def _tab_optimize():
+    """Optimize tab: constraint tuning and sensitivity."""
+    st.header("Budget Optimization")
+    st.markdown("Interactive what-if analysis with constraint tuning")
+    
+    if not st.session_state.plan:
+        st.warning("⚠️ Please generate a plan first in the Plan tab")
+    else:
+        st.subheader("🎛️ Constraint Tuning")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            new_roas = st.slider(
+                "ROAS Floor",
+                min_value=2.0,
+                max_value=4.0,
+                value=3.0,
+                step=0.1,
+                help="Minimum acceptable ROAS"
+            )
+            
+            new_exp = st.slider(
+                "Experiment Share (%)",
+                min_value=0,
+                max_value=20,
+                value=10,
+                step=1
+            )
+        
+        with col2:
+            oos_threshold = st.slider(
+                "OOS Threshold (%)",
+                min_value=0,
+                max_value=20,
+                value=5,
+                step=1,
+                help="Exclude SKUs with out-of-stock probability above this"
+            )
+            
+            max_per_retailer = st.number_input(
+                "Max per Retailer ($)",
+                value=1500000,
+                step=100000
+            )
+        
+        if st.button("🔄 Re-optimize", type="primary"):
+            with st.spinner("Re-running optimization..."):
+                if DEMO_SLEEP:
+                    time.sleep(1.5)
+                
+                new_plan = get_optimizer().generate_plan(
+                    budget=st.session_state.plan['budget'],
+                    roas_floor=new_roas,
+                    exp_share=new_exp / 100,
+                    oos_threshold=oos_threshold / 100
+                )
+                
+                st.session_state.previous_plan = st.session_state.plan
+                st.session_state.plan = new_plan
+                st.rerun()  # Refresh the Plan tab as well
+        
+        if 'previous_plan' in st.session_state:
+            previous_plan = st.session_state.previous_plan
+            st.success("✅ Optimization complete!")
+            
+            # Show delta
+            st.subheader("📈 Changes vs Previous Plan")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                delta_roas = st.session_state.plan['expected_roas'] - previous_plan['expected_roas']
+                st.metric("ROAS", f"{st.session_state.plan['expected_roas']:.2f}x", f"{delta_roas:+.2f}x")
+            with col2:
+                delta_rev = st.session_state.plan['incremental_revenue'] - previous_plan['incremental_revenue']
+                st.metric("Incremental Revenue", f"${st.session_state.plan['incremental_revenue']:,.0f}", f"${delta_rev:+,.0f}")
+            with col3:
+                st.metric("Reallocated SKUs", "12", "")
+        
+        # Sensitivity analysis
+        st.divider()
+        st.subheader("📊 Sensitivity Analysis")
+        
+        st.dataframe(_sensitivity_table(), use_container_width=True, hide_index=True)
+
+
+with tab3:
+    _tab_optimize()
+
+# TAB 4: MEASUREMENT
+@st.fragment
+def _tab_measure():
+    """Measure tab: experiment design and readout SQL."""
+    st.header("Measurement & Experimentation")
+    st.markdown("Design experiments and generate lift readout SQL")
+    
+    st.subheader("🧪 Experiment Design")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        exp_type = st.selectbox(
+            "Experiment Type",
+            ["Geo Split Test", "Audience Holdout", "Budget Pacing Test"]
+        )
+        
+        min_cells = st.number_input("Minimum Cells", value=2, min_value=2, max_value=10)
+        power_target = st.slider("Statistical Power", 0.7, 0.95, 0.8, 0.05)
+    
+    with col2:
+        mde = st.number_input("Minimum Detectable Effect (%)", value=10, min_value=5, max_value=50)
+        duration_days = st.number_input("Duration (days)", value=14, min_value=7, max_value=90)
+    
+    if st.button("🎯 Design Experiment"):
+        st.session_state.design_future = _agent_executor().submit(
+            _run_agent, 1, get_experiment_designer().design_experiment,
+            exp_type=exp_type,
+            min_cells=min_cells,
+            power=power_target,
+            mde=mde / 100
+        )
+        st.rerun()  # Starts the poller below the tab fragment
+    
+    if st.session_state.design:
+        design = st.session_state.design
+        
+        # Show design
+        st.subheader("📋 Experiment Plan")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Treatment Cells", design['cells'])
+        with col2:
+            st.metric("Sample Size per Cell", design['sample_size'])
+        with col3:
+            st.metric("Expected Power", f"{design['power']:.1%}")
+        
+        # Cell assignment
+        st.subheader("🗺️ Cell Assignment")
+        st.dataframe(design['cell_assignment'], use_container_width=True)
+        
+        # SQL for readout
+        st.subheader("📝 Lift Readout SQL")
+        st.code(design['sql'], language="sql")
+        
+        with st.expander("💡 Interpretation Guide"):
+            st.markdown("""
+            **How to read results:**
+            1. Wait for experiment duration to complete
+            2. Run the SQL query above
+            3. Compare treatment vs control metrics
+            4. Check if lift is statistically significant (p < 0.05)
+            5. Calculate incremental ROAS
+            """)
+
+
+with tab4:
+    _tab_measure()
+    _agent_error('design')
+    if 'design_future' in st.session_state:
+        _await_agent('design_future', 'design', "Designing experiment...")
+
+# TAB 5: CREATIVE
+@st.fragment
+def _tab_creative():
+    """Creative tab: copy generation with policy checks."""
+    st.header("Creative Generation")
+    st.markdown("AI-generated ad copy with policy compliance checking")
+    
+    st.subheader("🎨 Generate Creative")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        selected_skus = st.multiselect(
+            "Select SKUs",
+            options=_ALL_SKUS,
+            default=_DEFAULT_SKUS
+        )
+        
+        retailer_for_creative = st.selectbox(
+            "Target Retailer",
+            ["Alpha", "Beta"]
+        )
+        
+        tone = st.selectbox(
+            "Tone",
+            ["Professional", "Casual", "Urgent", "Premium"]
+        )
+    
+    with col2:
+        st.markdown("**Retailer Specs**")
+        if retailer_for_creative == "Alpha":
+            st.info("Max headline: 80 chars")
+            st.info("Max body: 250 chars")
+            st.warning("Disallowed: 'guaranteed', 'miracle'")
+        else:
+            st.info("Max headline: 60 chars")
+            st.info("Max body: 200 chars")
+            st.warning("Disallowed: 'best', 'free'")
+    
+    if st.button("✨ Generate Copy", type="primary"):
+        with st.spinner("🤖 Creative Agent working..."):
+            if DEMO_SLEEP:
+                time.sleep(1.5)
+            
+            creatives = get_creative_gen().generate(
+                skus=selected_skus,
+                retailer=retailer_for_creative.lower(),
+                tone=tone.lower()
+            )
+            
+            st.success(f"✅ Generated {len(creatives)} creative variants")
+            
+            # Show creatives
+            for i, creative in enumerate(creatives):
+                with st.expander(f"Variant {i+1} - {creative['sku']} - {'✅ PASS' if creative['policy_pass'] else '❌ FAIL'}"):
+                    col1, col2 = st.columns([3, 1])
+                    
+                    with col1:
+                        st.markdown(f"**Headline:** {creative['headline']}")
+                        st.markdown(f"**Body:** {creative['body']}")
+                        st.caption(f"Headline: {len(creative['headline'])} chars | Body: {len(creative['body'])} chars")
+                    
+                    with col2:
+                        if creative['policy_pass']:
+                            st.success("✅ Policy Check PASS")
+                        else:
+                            st.error("❌ Policy Check FAIL")
+                            for reason in creative['policy_reasons']:
+                                st.caption(f"• {reason}")
+                            
+                            if st.button(f"🔧 Fix", key=f"fix_{i}"):
+                                st.info("Auto-fixing violations...")
+                                # Simulate fix
+                                creative['policy_pass'] = True
+                                creative['policy_reasons'] = []
+                                st.rerun()
+
+
+with tab5:
+    _tab_creative()
+
+# TAB 6: OPS
+@st.fragment
+def _tab_ops():
+    """Ops tab: system status, logs and data quality."""
+    st.header("Operations & Observability")
+    st.markdown("System logs, adapter composition, and quality checks")
+    
+    # System status
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("System Health", "Healthy", "")
+        st.metric("API Latency", "145ms", "-12ms")
+    
+    with col2:
+        st.metric("Active Adapters", "4", "")
+        st.metric("Tool Calls (24h)", "1,247", "+89")
+    
+    with col3:
+        st.metric("Data Freshness", "2 min", "")
+        st.metric("Error Rate", "0.02%", "-0.01%")
+    
+    st.divider()
+    
+    # Adapter composition log
+    st.subheader("🔧 Adapter Composition Log")
+    
+    st.dataframe(_adapter_log_table(), use_container_width=True, hide_index=True)
+    
+    # Tool call log
+    st.subheader("📞 Recent Tool Calls")
+    
+    st.dataframe(_tool_log_table(), use_container_width=True, hide_index=True)
+    
+    # Data quality
+    st.subheader("📊 Data Quality Metrics")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**Enum Coverage**")
+        st.dataframe(_enum_coverage_table(), use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.markdown("**Join Success Rates**")
+        st.dataframe(_join_rates_table(), use_container_width=True, hide_index=True)
+
+
+with tab6:
+    _tab_ops()
+
+# Footer
+st.divider()
+st.caption("🎯 RMN LoRA System Demo | Powered by Composable LoRA Adapters")
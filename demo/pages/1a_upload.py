@@ -0,0 +1,90 @@
+"""Build Your Model Wizard - Step 1: Upload proprietary data."""
+
+import streamlit as st
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from demo.build_wizard import (
+    LARGE_UPLOAD_BYTES, PREVIEW_ROWS, complete, go_to, paginated_preview,
+    parse_full_upload, parse_uploaded_csv, render_page, upload_meta
+)
+
+render_page("upload")
+
+st.header("Step 1: Upload Your Proprietary Data")
+
+st.markdown("""
+### 🔒 What Makes Your Data Valuable?
+
+Your manufacturer data contains insights generic models can't know:
+- 📊 **Historical performance** of YOUR products at specific retailers
+- 🎯 **Product affinities** unique to your brand  
+- 💰 **Margin optimization** based on your cost structure
+- 🎨 **Brand voice** and messaging that resonates
+""")
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.subheader("Upload Campaign Data")
+    uploaded_file = st.file_uploader(
+        "Upload CSV with historical campaigns",
+        type=['csv'],
+        help="Include: campaign_id, product, retailer, spend, revenue, conversions"
+    )
+    
+    large_upload = uploaded_file is not None and uploaded_file.size > LARGE_UPLOAD_BYTES
+    
+    if large_upload:
+        raw = uploaded_file.getvalue()
+        preview = parse_uploaded_csv(uploaded_file.name, raw, nrows=PREVIEW_ROWS)
+        st.success(
+            f"✅ Previewing {uploaded_file.name} ({uploaded_file.size / 1e6:.0f} MB); "
+            "the full file is parsed when you continue"
+        )
+        st.dataframe(preview.head(10), use_container_width=True)
+    elif uploaded_file:
+        raw = uploaded_file.getvalue()
+        df = parse_uploaded_csv(uploaded_file.name, raw)
+        st.session_state.upload_meta = stats = upload_meta(uploaded_file.name, raw, df)
+        st.success(f"✅ Loaded {uploaded_file.name}")
+        
+        paginated_preview(df, stats["memory_mb"])
+        
+        st.subheader("📊 Data Quality")
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            st.metric("Records", f"{stats['rows']:,}")
+        with col_b:
+            st.metric("Completeness", f"{stats['completeness']:.0f}%")
+        with col_c:
+            st.metric("Columns", stats['cols'])
+
+with col2:
+    st.info("""
+    ### 🔒 Privacy Guarantee
+    
+    Your data:
+    - ✅ Stays in your environment
+    - ✅ Trains YOUR LoRA only
+    - ✅ Never shared with others
+    - ✅ Full encryption at rest
+    
+    **You own the resulting model.**
+    """)
+
+st.markdown("<br>", unsafe_allow_html=True)
+
+if large_upload or st.session_state.upload_meta is not None:
+    if st.button("Next: Define Brand Voice →", type="primary", use_container_width=True):
+        if large_upload:
+            with st.spinner("Parsing full file..."):
+                df = parse_full_upload(uploaded_file.name, raw, preview)
+                st.session_state.upload_meta = upload_meta(uploaded_file.name, raw, df)
+        complete("upload")
+        go_to("brand")
@@ -0,0 +1,59 @@
+"""Build Your Model Wizard - Step 2: Define the brand voice."""
+
+import streamlit as st
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from demo.build_wizard import complete, go_to, render_page
+
+
+def _brand_voice_form() -> bool:
+    """Brand inputs in one form; returns True when submitted."""
+    with st.form("brand_voice"):
+        brand_tone = st.selectbox(
+            "Brand Tone",
+            ["Premium", "Accessible", "Innovative", "Traditional", "Playful"]
+        )
+        
+        st.text_area(
+            "Brand Guidelines (optional)",
+            placeholder="E.g., Always emphasize sustainability, avoid price competition messaging...",
+            height=120
+        )
+        
+        st.subheader("Example Brand Messages")
+        st.markdown("Provide 3-5 examples of your best-performing ad copy:")
+        
+        for i in range(3):
+            st.text_input(f"Example {i+1}", key=f"example_{i}", placeholder="Your best ad headline or copy")
+        
+        return st.form_submit_button("Next: Configure Training →", type="primary", use_container_width=True)
+
+
+render_page("brand")
+
+st.header("Step 2: Define Your Brand Voice")
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    if _brand_voice_form():
+        complete("brand")
+        go_to("config")
+
+with col2:
+    st.success(f"""
+    ### ✅ Data Loaded
+    
+    {st.session_state.upload_meta['rows']:,} historical records ready for training
+    """)
+
+col_a, col_b = st.columns(2)
+with col_a:
+    if st.button("← Back", use_container_width=True):
+        go_to("upload")
@@ -0,0 +1,80 @@
+"""Build Your Model Wizard - Step 3: Configure training."""
+
+import streamlit as st
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from demo.build_wizard import complete, go_to, render_page, training_estimate
+
+
+def _training_config() -> bool:
+    """Training sliders in one form; returns True when training should start.
+    
+    The sliders start from the saved config, and both submit buttons save
+    the slider values, so starting training never drops unsaved changes.
+    """
+    config = st.session_state.training_config
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Training Parameters")
+        
+        with st.form("training_config_form"):
+            epochs = st.slider("Training Epochs", 1, 10, config['epochs'], help="More epochs = better fit but longer training")
+            learning_rate = st.select_slider("Learning Rate", options=["Conservative", "Balanced", "Aggressive"], value=config['learning_rate'])
+            lora_rank = st.slider("LoRA Rank", 8, 64, config['lora_rank'], help="Higher rank = more capacity")
+            
+            col_update, col_start = st.columns(2)
+            with col_update:
+                update = st.form_submit_button("Update Estimate", use_container_width=True)
+            with col_start:
+                start = st.form_submit_button("Start Training →", type="primary", use_container_width=True)
+            
+            if update or start:
+                st.session_state.training_config = config = training_estimate(epochs, learning_rate, lora_rank)
+        
+        st.info(f"""
+        **Selected Config:**
+        - Epochs: {config['epochs']}
+        - Learning Rate: {config['learning_rate']}
+        - LoRA Rank: {config['lora_rank']}
+        """)
+    
+    with col2:
+        st.subheader("💰 Estimated Costs")
+        
+        st.metric("Training Time", f"{config['training_mins']} minutes")
+        st.metric("GPU Cost", f"${config['cost']:.2f}")
+        st.metric("Total Cost", f"${config['cost']:.2f}")
+        
+        st.success("""
+        💡 **Compare to alternatives:**
+        - Full model training: $42,000
+        - Traditional ML: $15,000
+        - LoRA: $8.40
+        
+        **99.98% cost savings!**
+        """)
+    
+    return start
+
+
+render_page("config")
+
+st.header("Step 3: Configure Training")
+
+if _training_config():
+    st.session_state.training_progress = 0
+    st.session_state.completed_steps.discard("train")
+    complete("config")
+    go_to("train")
+
+col_a, col_b = st.columns(2)
+with col_a:
+    if st.button("← Back", use_container_width=True):
+        go_to("brand")
@@ -0,0 +1,49 @@
+"""Build Your Model Wizard - Step 4: Train the manufacturer LoRA."""
+
+import streamlit as st
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from demo.build_wizard import complete, go_to, render_page
+
+
+@st.fragment(run_every=0.3)
+def _training_ticker():
+    """Advance the simulated training run; each tick reruns only this fragment."""
+    st.session_state.training_progress = min(st.session_state.training_progress + 20, 100)
+    progress = st.session_state.training_progress
+    
+    if progress >= 100:
+        st.rerun()  # Full rerun renders the completed-training view
+    
+    st.progress(progress / 100)
+    st.info(f"⏳ Training epoch {progress // 33 + 1}/3...")
+
+
+render_page("train")
+
+st.header("Step 4: Training Your Manufacturer LoRA")
+
+# Simulate training
+if st.session_state.training_progress < 100:
+    _training_ticker()
+else:
+    st.progress(1.0)
+    st.success("✅ Training complete!")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Final Loss", "0.34", "↓ 71%")
+    with col2:
+        st.metric("Validation Accuracy", "94%", "↑ 23%")
+    with col3:
+        st.metric("Training Time", "47 min")
+    
+    if st.button("Next: Test & Deploy →", type="primary"):
+        complete("train")
+        go_to("deploy")
@@ -0,0 +1,64 @@
+"""Build Your Model Wizard - Step 5: Test and deploy."""
+
+import streamlit as st
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from demo.build_wizard import render_page, restart
+
+render_page("deploy")
+
+st.header("Step 5: Test & Deploy")
+
+st.success("🎉 Your proprietary manufacturer LoRA is ready!")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("### Before (Generic + Industry)")
+    st.metric("Expected ROAS", "2.8x")
+    st.metric("Accuracy", "67%")
+    st.metric("SKU Coverage", "85%")
+
+with col2:
+    st.markdown("### After (+ Your LoRA)")
+    st.metric("Expected ROAS", "3.5x", "+25%")
+    st.metric("Accuracy", "89%", "+33%")
+    st.metric("SKU Coverage", "98%", "+15%")
+
+st.markdown("---")
+st.subheader("🧪 Test Your Model")
+
+test_query = st.text_area("Enter a planning query", "Allocate $2.5M to maximize incremental margin")
+
+if st.button("Test Query", type="primary"):
+    with st.spinner("Running inference..."):
+        time.sleep(1)
+        st.success("✅ Query processed using YOUR proprietary model")
+        st.json({
+            "model_used": "llama-3.1-8b + industry_retail + YOUR_manufacturer_lora",
+            "confidence": 0.94,
+            "insights_from_proprietary_data": [
+                "Product affinity: Snack + Beverage (YOUR data)",
+                "Optimal margin products for Q1 (YOUR historical performance)"
+            ]
+        })
+
+st.markdown("---")
+
+col_a, col_b = st.columns([2, 1])
+
+with col_a:
+    if st.button("🚀 Deploy to Production", type="primary", use_container_width=True):
+        st.balloons()
+        st.success("✅ Deployed! Your proprietary AI is now live.")
+
+with col_b:
+    if st.button("🔄 Start Over", use_container_width=True):
+        restart()
@@ -1,12 +1,72 @@
 """Data Privacy & IP Protection Story - Explains federated LoRA security model."""
 
 import streamlit as st
-import pandas as pd
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Static page markup; each block is emitted with a single st.html call
+PRIVACY_CARDS_HTML = """
+<div class="card-grid">
+    <div class="privacy-card">
+        <h3 style="color: #2E7D32;">🔐 Data Never Leaves</h3>
+        <p>Your training data stays in your environment. No data sharing, no data pooling.</p>
+        <p style="font-weight: 600; margin-top: 1rem;">You control: Storage, Access, Encryption</p>
+    </div>
+    <div class="privacy-card">
+        <h3 style="color: #2E7D32;">🏆 Your LoRA = Your IP</h3>
+        <p>The resulting LoRA adapter is YOUR intellectual property. Competitors can't replicate it.</p>
+        <p style="font-weight: 600; margin-top: 1rem;">You own: Model weights, Training config, Insights</p>
+    </div>
+    <div class="privacy-card">
+        <h3 style="color: #2E7D32;">🛡️ Zero Knowledge</h3>
+        <p>Training happens locally. Base model provider sees nothing. Industry LoRA learns from aggregated data only.</p>
+        <p style="font-weight: 600; margin-top: 1rem;">Protected: Product data, Margins, Strategies</p>
+    </div>
+</div>
+"""
+
+THREAT_CARDS_HTML = """
+<div class="card-grid">
+    <div class="threat-card">
+        <h4>❌ Threats Eliminated</h4>
+        <ul>
+            <li><strong>Data Leakage</strong>: Your data never leaves your control</li>
+            <li><strong>Competitor Access</strong>: Your LoRA is private, not shared</li>
+            <li><strong>Vendor Lock-in</strong>: LoRA is open standard, portable</li>
+            <li><strong>IP Theft</strong>: Legally protected as your trade secret</li>
+            <li><strong>Model Poisoning</strong>: You control training data</li>
+        </ul>
+    </div>
+    <div class="privacy-card">
+        <h4>✅ Security Guarantees</h4>
+        <ul>
+            <li><strong>Encryption at Rest</strong>: All data encrypted in your environment</li>
+            <li><strong>Encryption in Transit</strong>: TLS 1.3 for all connections</li>
+            <li><strong>Access Control</strong>: You manage who can use your LoRA</li>
+            <li><strong>Audit Trail</strong>: Full logging of model usage</li>
+            <li><strong>Compliance</strong>: GDPR, CCPA, SOC 2 ready</li>
+        </ul>
+    </div>
+</div>
+"""
+
+CTA_HTML = """
+<div style="text-align: center; padding: 2rem; background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%); border-radius: 1rem; border: 2px solid #4CAF50;">
+    <h2 style="color: #2E7D32;">Ready to Build Your Protected Competitive Advantage?</h2>
+    <p style="font-size: 1.1rem; color: #2E7D32; margin: 1rem 0;">
+        Your data stays private. Your LoRA stays yours. Your insights stay exclusive.
+    </p>
+</div>
+"""
 
 # Page config
 st.set_page_config(
@@ -15,29 +75,15 @@ st.set_page_config(
     layout="wide"
 )
 
+
 # CSS
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Archivo:wght@300;400;500;600;700&display=swap');
-    * { font-family: 'Archivo', sans-serif; }
-    
-    .privacy-card {
-        background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%);
-        padding: 2rem;
-        border-radius: 1rem;
-        border: 2px solid #4CAF50;
-        margin: 1rem 0;
-    }
-    
-    .threat-card {
-        background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%);
-        padding: 2rem;
-        border-radius: 1rem;
-        border: 2px solid #f44336;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def _css() -> str:
+    """Load the page stylesheet once per server process."""
+    return (Path(__file__).parent / "privacy_style.css").read_text()
+
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 # Header
 st.title("🔒 Your Data, Your Competitive Advantage")
@@ -51,34 +97,7 @@ remains YOUR competitive advantage. Here's how:
 # Key Promise
 st.markdown("---")
 
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.markdown("""
-    <div class="privacy-card">
-        <h3 style="color: #2E7D32;">🔐 Data Never Leaves</h3>
-        <p>Your training data stays in your environment. No data sharing, no data pooling.</p>
-        <p style="font-weight: 600; margin-top: 1rem;">You control: Storage, Access, Encryption</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
-    <div class="privacy-card">
-        <h3 style="color: #2E7D32;">🏆 Your LoRA = Your IP</h3>
-        <p>The resulting LoRA adapter is YOUR intellectual property. Competitors can't replicate it.</p>
-        <p style="font-weight: 600; margin-top: 1rem;">You own: Model weights, Training config, Insights</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
-    <div class="privacy-card">
-        <h3 style="color: #2E7D32;">🛡️ Zero Knowledge</h3>
-        <p>Training happens locally. Base model provider sees nothing. Industry LoRA learns from aggregated data only.</p>
-        <p style="font-weight: 600; margin-top: 1rem;">Protected: Product data, Margins, Strategies</p>
-    </div>
-    """, unsafe_allow_html=True)
+st.html(PRIVACY_CARDS_HTML)
 
 # Data Flow Diagram
 st.markdown("---")
@@ -122,94 +141,74 @@ st.code("""
 st.markdown("---")
 st.markdown("## 📊 Federated LoRA vs Traditional Approaches")
 
-comparison = pd.DataFrame({
-    'Aspect': [
-        'Training Data Location',
-        'Data Sharing',
-        'Model Ownership',
-        'Competitive Insights',
-        'Vendor Lock-in',
-        'Privacy Compliance',
-        'IP Protection',
-        'Update Control'
-    ],
-    'Traditional SaaS AI': [
-        '❌ Vendor cloud (shared)',
-        '❌ Pooled with other customers',
-        '❌ Vendor owns the model',
-        '⚠️ Everyone gets same insights',
-        '🔴 High (proprietary format)',
-        '⚠️ Depends on vendor',
-        '❌ Weak (your data trains shared model)',
-        '❌ Vendor controls timing'
-    ],
-    'Managed AI Services': [
-        '⚠️ Their infrastructure',
-        '⚠️ "Isolated" but on their systems',
-        '⚠️ Licensed, not owned',
-        '⚠️ Limited to provided features',
-        '🟡 Medium (API dependency)',
-        '✅ Usually compliant',
-        '⚠️ Contractual only',
-        '⚠️ Requires vendor support'
-    ],
-    'Federated LoRA ⭐': [
-        '✅ YOUR environment (local/private cloud)',
-        '✅ ZERO data sharing',
-        '✅ YOU own the LoRA adapter',
-        '✅ Unique to your data',
-        '🟢 None (open standard)',
-        '✅ Full control',
-        '✅ Strong (legally protected IP)',
-        '✅ You control everything'
-    ]
-})
-
-st.dataframe(
-    comparison,
-    use_container_width=True,
-    hide_index=True,
-    column_config={
-        'Aspect': st.column_config.TextColumn('Privacy & IP Aspect', width='medium'),
-        'Traditional SaaS AI': st.column_config.TextColumn('SaaS AI', width='medium'),
-        'Managed AI Services': st.column_config.TextColumn('Managed Services', width='medium'),
-        'Federated LoRA ⭐': st.column_config.TextColumn('Federated LoRA', width='medium')
-    }
-)
+
+@st.cache_resource
+def _comparison_df() -> "pd.DataFrame":
+    """Build the static comparison table once per server process (never mutated)."""
+    import pandas as pd  # Only needed for this one-off build
+    
+    return pd.DataFrame({
+        'Aspect': [
+            'Training Data Location',
+            'Data Sharing',
+            'Model Ownership',
+            'Competitive Insights',
+            'Vendor Lock-in',
+            'Privacy Compliance',
+            'IP Protection',
+            'Update Control'
+        ],
+        'Traditional SaaS AI': [
+            '❌ Vendor cloud (shared)',
+            '❌ Pooled with other customers',
+            '❌ Vendor owns the model',
+            '⚠️ Everyone gets same insights',
+            '🔴 High (proprietary format)',
+            '⚠️ Depends on vendor',
+            '❌ Weak (your data trains shared model)',
+            '❌ Vendor controls timing'
+        ],
+        'Managed AI Services': [
+            '⚠️ Their infrastructure',
+            '⚠️ "Isolated" but on their systems',
+            '⚠️ Licensed, not owned',
+            '⚠️ Limited to provided features',
+            '🟡 Medium (API dependency)',
+            '✅ Usually compliant',
+            '⚠️ Contractual only',
+            '⚠️ Requires vendor support'
+        ],
+        'Federated LoRA ⭐': [
+            '✅ YOUR environment (local/private cloud)',
+            '✅ ZERO data sharing',
+            '✅ YOU own the LoRA adapter',
+            '✅ Unique to your data',
+            '🟢 None (open standard)',
+            '✅ Full control',
+            '✅ Strong (legally protected IP)',
+            '✅ You control everything'
+        ]
+    })
+
+
+@st.cache_data
+def _comparison_html() -> str:
+    """Render the comparison table to a static HTML <table> once."""
+    return _comparison_df().rename(columns={
+        'Aspect': 'Privacy & IP Aspect',
+        'Traditional SaaS AI': 'SaaS AI',
+        'Managed AI Services': 'Managed Services',
+        'Federated LoRA ⭐': 'Federated LoRA'
+    }).to_html(index=False, classes="priv-table", border=0)
+
+
+st.html(_comparison_html())
 
 # Threat Model
 st.markdown("---")
 st.markdown("## 🛡️ What We Protect Against")
 
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("""
-    <div class="threat-card">
-        <h4>❌ Threats Eliminated</h4>
-        <ul>
-            <li><strong>Data Leakage</strong>: Your data never leaves your control</li>
-            <li><strong>Competitor Access</strong>: Your LoRA is private, not shared</li>
-            <li><strong>Vendor Lock-in</strong>: LoRA is open standard, portable</li>
-            <li><strong>IP Theft</strong>: Legally protected as your trade secret</li>
-            <li><strong>Model Poisoning</strong>: You control training data</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
-    <div class="privacy-card">
-        <h4>✅ Security Guarantees</h4>
-        <ul>
-            <li><strong>Encryption at Rest</strong>: All data encrypted in your environment</li>
-            <li><strong>Encryption in Transit</strong>: TLS 1.3 for all connections</li>
-            <li><strong>Access Control</strong>: You manage who can use your LoRA</li>
-            <li><strong>Audit Trail</strong>: Full logging of model usage</li>
-            <li><strong>Compliance</strong>: GDPR, CCPA, SOC 2 ready</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
+st.html(THREAT_CARDS_HTML)
 
 # Competitive Advantage
 st.markdown("---")
@@ -336,14 +335,7 @@ with st.expander("How is this different from federated learning?"):
 # Call to Action
 st.markdown("---")
 
-st.markdown("""
-<div style="text-align: center; padding: 2rem; background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%); border-radius: 1rem; border: 2px solid #4CAF50;">
-    <h2 style="color: #2E7D32;">Ready to Build Your Protected Competitive Advantage?</h2>
-    <p style="font-size: 1.1rem; color: #2E7D32; margin: 1rem 0;">
-        Your data stays private. Your LoRA stays yours. Your insights stay exclusive.
-    </p>
-</div>
-""", unsafe_allow_html=True)
+st.html(CTA_HTML)
 
 st.markdown("<br>", unsafe_allow_html=True)
 
@@ -359,4 +351,4 @@ with col2:
             st.switch_page("pages/0_welcome.py")
     with col_b:
         if st.button("📊 See Live Demo", use_container_width=True):
-            st.switch_page("streamlit_app.py")
+            st.switch_page("home.py")
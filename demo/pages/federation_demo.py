@@ -1,17 +1,21 @@
 """Federation Demo Page - Shows clean room comparison and adapter composition."""
 
 import streamlit as st
+import gc
+import os
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from typing import Optional
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
-from demo.federation_workflow import run_federation_demo
-from demo.components.federation_graph import (
-    render_federation_graph,
-    render_comparison_chart,
-    render_adapter_details
-)
-import json
+# Workflow, graph components and JSON parsers are imported where used, so the
+# initial-state page loads none of them
 
 st.set_page_config(
     page_title="Federation Demo - RMN LoRA",
@@ -19,18 +23,48 @@ st.set_page_config(
     layout="wide"
 )
 
-# Header
-st.title("🔗 Federated LoRA Demo")
-st.markdown("""
+# Automatic GC pauses and scheduled collections (seconds, and every Nth is full)
+GC_INTERVAL_S = 30
+GC_FULL_EVERY = 10
+
+
+def _collect_periodically():
+    """Young-generation collection every GC_INTERVAL_S, full every GC_FULL_EVERY ticks."""
+    tick = 0
+    while True:
+        time.sleep(GC_INTERVAL_S)
+        tick += 1
+        gc.collect(2 if tick % GC_FULL_EVERY == 0 else 1)
+
+
+@st.cache_resource
+def _disable_automatic_gc() -> threading.Thread:
+    """Turn off threshold-triggered GC once per server process.
+    
+    Automatic collections walk every live object, including the plan
+    DataFrames, and land in the middle of reruns. This affects every page
+    and session served by the process and raises RSS between scheduled
+    collections, so it is opt-in: set DEMO_DISABLE_GC=1 for a dedicated
+    demo server.
+    """
+    gc.disable()
+    collector = threading.Thread(target=_collect_periodically, name="demo-gc", daemon=True)
+    collector.start()
+    return collector
+
+
+if os.getenv("DEMO_DISABLE_GC", "0") == "1":
+    _disable_automatic_gc()
+
+# Static page markup; each block is emitted with a single st.markdown/st.html call
+INTRO_MD = """
 This demo showcases the power of **federated LoRA adapters** compared to clean-room-only analytics.
 See how combining Generic LLM + Industry LoRA + Manufacturer LoRA delivers superior results.
-""")
 
-# Value Attribution Section
-st.markdown("---")
-st.markdown("## 🎯 What You're Seeing")
+---
+
+## 🎯 What You're Seeing
 
-st.markdown("""
 This demo compares **three approaches** to RMN optimization:
 
 1. **🟥 Generic LLM Only**: Base model with no specialized knowledge
@@ -38,12 +72,10 @@ This demo compares **three approaches** to RMN optimization:
 3. **🟩 Full Federation (Your Competitive Advantage)**: Generic + Industry + YOUR Manufacturer LoRA
 
 Watch how each layer adds value:
-""")
-
-col1, col2, col3 = st.columns(3)
+"""
 
-with col1:
-    st.markdown("""
+VALUE_CARDS_HTML = """
+<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">
     <div style="background: linear-gradient(135deg, #f5f5f5 0%, #e0e0e0 100%); 
                 padding: 1.5rem; border-radius: 0.75rem; border: 2px solid #9E9E9E;">
         <h3 style="color: #616161;">🧠 Generic LLM</h3>
@@ -57,10 +89,6 @@ with col1:
         <p style="font-size: 1.2rem; color: #616161; font-weight: 700;">ROAS: 2.1x</p>
         <p style="font-size: 0.85rem; color: #757575;">Baseline performance</p>
     </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
     <div style="background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%); 
                 padding: 1.5rem; border-radius: 0.75rem; border: 2px solid #2196F3;">
         <h3 style="color: #1976D2;">🏢 Industry LoRA</h3>
@@ -74,10 +102,6 @@ with col2:
         <p style="font-size: 1.2rem; color: #1976D2; font-weight: 700;">ROAS: 2.8x (+33%)</p>
         <p style="font-size: 0.85rem; color: #1976D2;">Shared industry knowledge</p>
     </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
     <div style="background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%); 
                 padding: 1.5rem; border-radius: 0.75rem; border: 2px solid #4CAF50;">
         <h3 style="color: #2E7D32;">🏭 Your LoRA</h3>
@@ -91,7 +115,388 @@ with col3:
         <p style="font-size: 1.2rem; color: #2E7D32; font-weight: 700;">ROAS: 3.5x (+25% more)</p>
         <p style="font-size: 0.85rem; color: #2E7D32; font-weight: 600;">🏆 Competitive advantage</p>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+"""
+
+KEY_INSIGHTS_HTML = """
+<h3>💡 Key Insights</h3>
+<div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
+    <div style="background: rgba(33, 195, 84, 0.1); color: #177233; padding: 1rem; border-radius: 0.5rem;">
+        <strong>With Federation (Full Data):</strong>
+        <ul>
+            <li>✅ Access to margin data for profitability optimization</li>
+            <li>✅ Stock levels for out-of-stock avoidance</li>
+            <li>✅ Promotional flags for timing optimization</li>
+            <li>✅ Price elasticity modeling</li>
+            <li>✅ {full_data_skus} SKUs optimized</li>
+        </ul>
+    </div>
+    <div style="background: rgba(255, 189, 69, 0.2); color: #926c05; padding: 1rem; border-radius: 0.5rem;">
+        <strong>Clean Room Only:</strong>
+        <ul>
+            <li>❌ No margin visibility</li>
+            <li>❌ No stock level data</li>
+            <li>❌ No promotional timing</li>
+            <li>❌ Limited to aggregated metrics</li>
+            <li>⚠️ Only {clean_room_skus} SKUs optimized</li>
+        </ul>
+    </div>
+</div>
+<h3>📈 Performance Delta</h3>
+"""
+
+FEDERATION_OVERVIEW_HTML = """
+<div style="background: rgba(28, 131, 225, 0.1); color: #004280; padding: 1rem; border-radius: 0.5rem;">
+    👈 Configure your demo settings in the sidebar and click <strong>Run Demo</strong> to see:
+    <ol>
+        <li><strong>Clean Room vs Full Data Comparison</strong> - See the performance delta</li>
+        <li><strong>Federation Graph</strong> - Visualize adapter composition</li>
+        <li><strong>Plan Details</strong> - Compare optimization results</li>
+        <li><strong>Creative Generation</strong> - Brand-compliant ad copy</li>
+    </ol>
+</div>
+<h3>🏗️ Federation Architecture</h3>
+<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">
+    <div>
+        <strong>Generic LLM</strong>
+        <ul>
+            <li>Base reasoning</li>
+            <li>Tool use</li>
+            <li>Schema comprehension</li>
+        </ul>
+    </div>
+    <div>
+        <strong>+ Industry LoRA</strong>
+        <ul>
+            <li>RMIS schema</li>
+            <li>Clean room protocols</li>
+            <li>Campaign metrics</li>
+        </ul>
+    </div>
+    <div>
+        <strong>+ Manufacturer LoRA</strong>
+        <ul>
+            <li>Brand tone</li>
+            <li>Private metrics</li>
+            <li>Product hierarchies</li>
+        </ul>
+    </div>
+</div>
+<hr>
+<h3>💎 Why Federation?</h3>
+<div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
+    <div>
+        <strong>Clean Room Limitations:</strong>
+        <ul>
+            <li>❌ No margin/profitability data</li>
+            <li>❌ No inventory levels</li>
+            <li>❌ No promotional flags</li>
+            <li>❌ Aggregated data only</li>
+            <li>❌ Limited SKU coverage</li>
+        </ul>
+    </div>
+    <div>
+        <strong>Federation Advantages:</strong>
+        <ul>
+            <li>✅ Full data access via manufacturer adapter</li>
+            <li>✅ Stock-out avoidance</li>
+            <li>✅ Promotional timing optimization</li>
+            <li>✅ Margin-aware allocation</li>
+            <li>✅ 50% more SKUs optimized</li>
+        </ul>
+    </div>
+</div>
+"""
+
+
+# Mock adapter metadata lives in demo/mock_adapters/<adapter_id>/
+_ADAPTERS_ROOT = Path(__file__).resolve().parent.parent / "mock_adapters"
+
+# Performance-delta row: (label, comparison key)
+DELTA_METRICS = (
+    ("ROAS Improvement", "roas_delta_pct"),
+    ("Revenue Improvement", "revenue_delta_pct"),
+    ("Accuracy Improvement", "accuracy_delta_pct"),
+    ("SKU Coverage", "sku_delta_pct"),
+)
+
+# Display-only metrics render as one st.html block; DEMO_HTML_METRICS=0 restores st.metric
+HTML_METRICS = os.getenv("DEMO_HTML_METRICS", "1") == "1"
+
+_METRIC_CARD_HTML = (
+    '<div style="flex: 1; min-width: 8rem;">'
+    '<div style="font-size: 0.875rem; color: #6b7280;">{label}</div>'
+    '<div style="font-size: 1.75rem;">{value}</div>{delta}</div>'
+)
+
+
+def _metric_row(metrics: list, vertical: bool = False):
+    """Render (label, value, delta) metrics; ``delta`` is an st.metric delta string or None."""
+    if not HTML_METRICS:
+        targets = [st] * len(metrics) if vertical else st.columns(len(metrics))
+        for target, (label, value, delta) in zip(targets, metrics):
+            target.metric(label, value, delta=delta)
+        return
+    
+    cards = []
+    for label, value, delta in metrics:
+        delta_html = ""
+        if delta is not None:
+            color, arrow = ("#ff2b2b", "↓") if delta.startswith("-") else ("#09ab3b", "↑")
+            delta_html = f'<div style="color: {color};">{arrow} {delta}</div>'
+        cards.append(_METRIC_CARD_HTML.format(label=label, value=value, delta=delta_html))
+    direction = "column" if vertical else "row"
+    st.html(f'<div style="display: flex; flex-direction: {direction}; gap: 1rem;">{"".join(cards)}</div>')
+
+
+# Progress line shown as each workflow step finishes
+_STEP_LABELS = {
+    "harmonization": "Data harmonized to RMIS",
+    "full_plan": "Full data plan generated",
+    "clean_room_plan": "Clean room plan generated",
+    "comparison": "Plans compared",
+    "creatives": "Creatives generated",
+    "visualization": "Federation graph composed",
+}
+
+
+@st.cache_resource(max_entries=16)
+def _completed_runs(budget: float, roas_floor: float, exp_share: float) -> dict:
+    """Slot for the finished results of one (budget, roas_floor, exp_share) run.
+    
+    Results live here rather than in session state, so abandoned browser tabs
+    do not pin DataFrames in memory; the LRU bound reclaims old runs.
+    """
+    return {}
+
+
+def _current_results() -> Optional[dict]:
+    """Results of this session's last run, or None if never run or evicted."""
+    params = st.session_state.get("demo_params")
+    if params is None:
+        return None
+    return _completed_runs(*params).get("results")
+
+
+@st.cache_resource
+def _pipeline_executor() -> ThreadPoolExecutor:
+    """Worker threads for demo runs, shared by all sessions (caps concurrent runs)."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="federation-demo")
+
+
+def _pump_federation(events: queue.Queue, budget: float, roas_floor: float, exp_share: float):
+    """Worker body: push each streamed workflow step onto ``events``."""
+    from demo.federation_workflow import run_federation_demo_stream
+    
+    for event in run_federation_demo_stream(
+        budget=budget,
+        roas_floor=roas_floor,
+        exp_share=exp_share
+    ):
+        events.put(event)
+
+
+def _run_federation(budget: float, roas_floor: float, exp_share: float) -> dict:
+    """Run the demo pipeline on a worker thread, reusing finished runs.
+    
+    The script thread polls for streamed steps and writes each into a status
+    panel, keeping the elapsed-time label live in between. Results are shared
+    across sessions through ``_completed_runs`` and must not be mutated.
+    """
+    slot = _completed_runs(budget, roas_floor, exp_share)
+    if "results" in slot:
+        return slot["results"]
+    
+    events = queue.Queue()
+    future = _pipeline_executor().submit(_pump_federation, events, budget, roas_floor, exp_share)
+    start = time.monotonic()
+    
+    steps = {}
+    with st.status("Running federation demo...", expanded=True) as status:
+        while not (future.done() and events.empty()):
+            try:
+                event = events.get(timeout=0.2)
+            except queue.Empty:
+                status.update(label=f"Running federation demo... {time.monotonic() - start:.0f}s")
+                continue
+            steps[event["step"]] = event["data"]
+            st.write(f"✅ {_STEP_LABELS[event['step']]}")
+            if event["step"] == "comparison":
+                st.metric("ROAS Improvement", f"{event['data']['roas_delta_pct']:.1f}%")
+        future.result()  # Re-raise any pipeline error
+        status.update(label="Federation demo complete", state="complete", expanded=False)
+    
+    slot["results"] = {"steps": steps}
+    return slot["results"]
+
+
+@st.cache_resource
+def _load_adapter_metadata(adapter_ids: tuple) -> dict:
+    """Read each adapter's metadata file once per server process.
+    
+    The returned dicts are shared across sessions and must not be mutated.
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    
+    adapter_metadata = {}
+    for adapter_id in adapter_ids:
+        try:
+            data = (_ADAPTERS_ROOT / adapter_id / "adapter_metadata.json").read_bytes()
+        except FileNotFoundError:
+            continue
+        adapter_metadata[adapter_id] = loads(data)
+    return adapter_metadata
+
+
+@st.fragment
+def _tab_comparison():
+    """Clean room vs full data comparison chart, insights and deltas."""
+    from demo.components.federation_graph import render_comparison_chart
+    
+    results = _current_results()
+    
+    st.header("Clean Room vs Full Data Comparison")
+    
+    comparison = results["steps"]["comparison"]
+    
+    # Render comparison chart
+    render_comparison_chart(comparison)
+    
+    # Key insights and the performance-delta heading
+    st.html(KEY_INSIGHTS_HTML.format(
+        full_data_skus=comparison['full_data_skus'],
+        clean_room_skus=comparison['clean_room_skus']
+    ))
+    
+    _metric_row([
+        (label, f"{comparison[key]:.1f}%", f"+{comparison[key]:.1f}%")
+        for label, key in DELTA_METRICS
+    ])
+
+
+@st.fragment
+def _tab_graph():
+    """Adapter composition graph and per-adapter metadata."""
+    from demo.components.federation_graph import render_federation_graph
+    
+    results = _current_results()
+    
+    st.header("Adapter Composition Flow")
+    
+    viz_data = results["steps"]["visualization"]
+    
+    # Get adapters from full plan
+    full_plan = results["steps"]["full_plan"]
+    adapters = full_plan.get("adapters_used", [])
+    
+    # Render federation graph
+    render_federation_graph(adapters, viz_data)
+    
+    # Adapter details
+    st.markdown("---")
+    st.subheader("📦 Adapter Details")
+    
+    # Load adapter metadata
+    adapter_metadata = _load_adapter_metadata(tuple(adapters))
+    
+    # Display in columns
+    if adapter_metadata:
+        cols = st.columns(len(adapter_metadata))
+        for idx, (adapter_id, metadata) in enumerate(adapter_metadata.items()):
+            with cols[idx]:
+                with st.expander(f"📦 {metadata.get('name', adapter_id)}", expanded=True):
+                    lines = [
+                        f"**Type:** {metadata.get('adapter_type', 'unknown').title()}",
+                        f"**Version:** {metadata.get('version', '1.0.0')}",
+                    ]
+                    caps = metadata.get('capabilities', [])
+                    if caps:
+                        lines.append("**Capabilities:**")
+                        lines.extend(f"- {cap}" for cap in caps[:3])
+                    st.markdown("\n\n".join(lines))
+
+
+@st.fragment
+def _tab_plan():
+    """Full-data and clean-room plans side by side."""
+    results = _current_results()
+    
+    st.header("Campaign Plan Details")
+    
+    # Show both plans side by side
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🟢 Full Data Plan")
+        full_plan = results["steps"]["full_plan"]
+    
+        _metric_row([
+            ("Expected ROAS", f"{full_plan.get('expected_roas', 0):.2f}x", None),
+            ("Expected Revenue", f"${full_plan.get('incremental_revenue', 0):,.0f}", None),
+            ("Budget Allocated", f"${full_plan.get('budget_allocated', 0):,.0f}", None),
+        ], vertical=True)
+    
+        if 'allocation' in full_plan:
+            st.markdown("**Top Allocations:**")
+            alloc = full_plan['allocation']
+            if hasattr(alloc, 'head'):
+                st.table(alloc.head(5).reset_index(drop=True))
+    
+    with col2:
+        st.subheader("🟡 Clean Room Plan")
+        clean_plan = results["steps"]["clean_room_plan"]
+    
+        _metric_row([
+            ("Expected ROAS", f"{clean_plan.get('expected_roas', 0):.2f}x", None),
+            ("Expected Revenue", f"${clean_plan.get('incremental_revenue', 0):,.0f}", None),
+            ("Budget Allocated", f"${clean_plan.get('budget_allocated', 0):,.0f}", None),
+        ], vertical=True)
+    
+        if 'allocation' in clean_plan:
+            st.markdown("**Top Allocations:**")
+            alloc = clean_plan['allocation']
+            if hasattr(alloc, 'head'):
+                st.table(alloc.head(5).reset_index(drop=True))
+
+
+@st.fragment
+def _tab_creatives():
+    """Generated creative variants with compliance status."""
+    results = _current_results()
+    
+    st.header("Generated Creatives")
+    
+    creatives_result = results["steps"]["creatives"]
+    creatives = creatives_result.get("creatives", [])
+    
+    st.markdown(f"""
+    **Adapters Used:** {', '.join(creatives_result.get('adapters_used', []))}  
+    **Compliance Rate:** {creatives_result.get('compliance_rate', 0):.1%}
+    """)
+    
+    # One table for every SKU x variant instead of a widget stack per variant
+    rows = [
+        {
+            "SKU": creative_set.get("sku"),
+            "Variant": idx + 1,
+            "Text": variant.get("text", ""),
+            "Compliant": "✅" if variant.get("compliant", True)
+                         else "❌ " + "; ".join(variant.get("violations", [])),
+        }
+        for creative_set in creatives
+        for idx, variant in enumerate(creative_set.get("variants", []))
+    ]
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+
+# Header
+st.title("🔗 Federated LoRA Demo")
+st.markdown(INTRO_MD)
+
+st.html(VALUE_CARDS_HTML)
 
 st.markdown("---")
 
@@ -99,61 +504,57 @@ st.markdown("---")
 with st.sidebar:
     st.header("⚙️ Demo Configuration")
     
-    # Clean room toggle
-    clean_room_mode = st.toggle(
-        "🔒 Clean Room Mode Only",
-        value=False,
-        help="Enable to see results with clean room restrictions (limited data access)"
-    )
-    
-    st.divider()
-    
-    # Budget settings
-    st.subheader("Budget Settings")
-    budget = st.number_input(
-        "Total Budget ($)",
-        min_value=100000,
-        max_value=10000000,
-        value=2500000,
-        step=100000
-    )
-    
-    roas_floor = st.slider(
-        "Minimum ROAS",
-        min_value=1.0,
-        max_value=5.0,
-        value=3.0,
-        step=0.1
-    )
-    
-    exp_share = st.slider(
-        "Experiment Budget %",
-        min_value=0.0,
-        max_value=0.3,
-        value=0.1,
-        step=0.05
-    )
-    
-    st.divider()
-    
-    # Run demo button
-    run_demo = st.button("▶️ Run Demo", type="primary", use_container_width=True)
+    # Inputs are batched in a form: dragging a slider only updates the browser,
+    # and Python runs once with the settled values when Run Demo is pressed.
+    # The tradeoff is that no result previews while the sliders move.
+    with st.form("demo_config", border=False):
+        # Clean room toggle
+        clean_room_mode = st.toggle(
+            "🔒 Clean Room Mode Only",
+            value=False,
+            help="Enable to see results with clean room restrictions (limited data access)"
+        )
+        
+        st.divider()
+        
+        # Budget settings
+        st.subheader("Budget Settings")
+        budget = st.number_input(
+            "Total Budget ($)",
+            min_value=100000,
+            max_value=10000000,
+            value=2500000,
+            step=100000
+        )
+        
+        roas_floor = st.slider(
+            "Minimum ROAS",
+            min_value=1.0,
+            max_value=5.0,
+            value=3.0,
+            step=0.1
+        )
+        
+        exp_share = st.slider(
+            "Experiment Budget %",
+            min_value=0.0,
+            max_value=0.3,
+            value=0.1,
+            step=0.05
+        )
+        
+        st.divider()
+        
+        # Run demo button
+        run_demo = st.form_submit_button("▶️ Run Demo", type="primary", use_container_width=True)
 
 # Main content
-if run_demo or 'demo_results' in st.session_state:
-    
-    # Run demo if button clicked
-    if run_demo:
-        with st.spinner("Running federation demo..."):
-            results = run_federation_demo(
-                budget=budget,
-                roas_floor=roas_floor,
-                exp_share=exp_share
-            )
-            st.session_state.demo_results = results
-    
-    results = st.session_state.demo_results
-    
+# Run demo if button clicked; the session keeps only the run's parameters
+if run_demo:
+    _run_federation(budget, roas_floor, exp_share)
+    st.session_state.demo_params = (budget, roas_floor, exp_share)
+
+if _current_results() is not None:
     # Create tabs for different views
     tab1, tab2, tab3, tab4 = st.tabs([
         "📊 Comparison",
@@ -164,243 +565,20 @@ if run_demo or 'demo_results' in st.session_state:
     
     # Tab 1: Comparison
     with tab1:
-        st.header("Clean Room vs Full Data Comparison")
-        
-        comparison = results["steps"]["comparison"]
-        
-        # Render comparison chart
-        render_comparison_chart(comparison)
-        
-        # Key insights
-        st.markdown("### 💡 Key Insights")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.success(f"""
-            **With Federation (Full Data):**
-            - ✅ Access to margin data for profitability optimization
-            - ✅ Stock levels for out-of-stock avoidance
-            - ✅ Promotional flags for timing optimization
-            - ✅ Price elasticity modeling
-            - ✅ {comparison['full_data_skus']} SKUs optimized
-            """)
-        
-        with col2:
-            st.warning(f"""
-            **Clean Room Only:**
-            - ❌ No margin visibility
-            - ❌ No stock level data
-            - ❌ No promotional timing
-            - ❌ Limited to aggregated metrics
-            - ⚠️ Only {comparison['clean_room_skus']} SKUs optimized
-            """)
-        
-        # Performance delta
-        st.markdown("### 📈 Performance Delta")
-        
-        delta_cols = st.columns(4)
-        
-        with delta_cols[0]:
-            st.metric(
-                "ROAS Improvement",
-                f"{comparison['roas_delta_pct']:.1f}%",
-                delta=f"+{comparison['roas_delta_pct']:.1f}%"
-            )
-        
-        with delta_cols[1]:
-            st.metric(
-                "Revenue Improvement",
-                f"{comparison['revenue_delta_pct']:.1f}%",
-                delta=f"+{comparison['revenue_delta_pct']:.1f}%"
-            )
-        
-        with delta_cols[2]:
-            st.metric(
-                "Accuracy Improvement",
-                f"{comparison['accuracy_delta_pct']:.1f}%",
-                delta=f"+{comparison['accuracy_delta_pct']:.1f}%"
-            )
-        
-        with delta_cols[3]:
-            st.metric(
-                "SKU Coverage",
-                f"{comparison['sku_delta_pct']:.1f}%",
-                delta=f"+{comparison['sku_delta_pct']:.1f}%"
-            )
+        _tab_comparison()
     
     # Tab 2: Federation Graph
     with tab2:
-        st.header("Adapter Composition Flow")
-        
-        viz_data = results["steps"]["visualization"]
-        
-        # Get adapters from full plan
-        full_plan = results["steps"]["full_plan"]
-        adapters = full_plan.get("adapters_used", [])
-        
-        # Render federation graph
-        render_federation_graph(adapters, viz_data)
-        
-        # Adapter details
-        st.markdown("---")
-        st.subheader("📦 Adapter Details")
-        
-        # Load adapter metadata
-        adapter_metadata = {}
-        for adapter_id in adapters:
-            metadata_path = Path(__file__).parent.parent / "mock_adapters" / adapter_id / "adapter_metadata.json"
-            if metadata_path.exists():
-                with open(metadata_path) as f:
-                    adapter_metadata[adapter_id] = json.load(f)
-        
-        # Display in columns
-        if adapter_metadata:
-            cols = st.columns(len(adapter_metadata))
-            for idx, (adapter_id, metadata) in enumerate(adapter_metadata.items()):
-                with cols[idx]:
-                    with st.expander(f"📦 {metadata.get('name', adapter_id)}", expanded=True):
-                        st.markdown(f"**Type:** {metadata.get('adapter_type', 'unknown').title()}")
-                        st.markdown(f"**Version:** {metadata.get('version', '1.0.0')}")
-                        
-                        caps = metadata.get('capabilities', [])
-                        if caps:
-                            st.markdown("**Capabilities:**")
-                            for cap in caps[:3]:
-                                st.markdown(f"- {cap}")
+        _tab_graph()
     
     # Tab 3: Plan Details
     with tab3:
-        st.header("Campaign Plan Details")
-        
-        # Show both plans side by side
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("🟢 Full Data Plan")
-            full_plan = results["steps"]["full_plan"]
-            
-            st.metric("Expected ROAS", f"{full_plan.get('expected_roas', 0):.2f}x")
-            st.metric("Expected Revenue", f"${full_plan.get('incremental_revenue', 0):,.0f}")
-            st.metric("Budget Allocated", f"${full_plan.get('budget_allocated', 0):,.0f}")
-            
-            if 'allocation' in full_plan:
-                st.markdown("**Top Allocations:**")
-                alloc = full_plan['allocation']
-                if hasattr(alloc, 'head'):
-                    st.dataframe(alloc.head(5), use_container_width=True)
-        
-        with col2:
-            st.subheader("🟡 Clean Room Plan")
-            clean_plan = results["steps"]["clean_room_plan"]
-            
-            st.metric("Expected ROAS", f"{clean_plan.get('expected_roas', 0):.2f}x")
-            st.metric("Expected Revenue", f"${clean_plan.get('incremental_revenue', 0):,.0f}")
-            st.metric("Budget Allocated", f"${clean_plan.get('budget_allocated', 0):,.0f}")
-            
-            if 'allocation' in clean_plan:
-                st.markdown("**Top Allocations:**")
-                alloc = clean_plan['allocation']
-                if hasattr(alloc, 'head'):
-                    st.dataframe(alloc.head(5), use_container_width=True)
+        _tab_plan()
     
     # Tab 4: Creatives
     with tab4:
-        st.header("Generated Creatives")
-        
-        creatives_result = results["steps"]["creatives"]
-        creatives = creatives_result.get("creatives", [])
-        
-        st.markdown(f"""
-        **Adapters Used:** {', '.join(creatives_result.get('adapters_used', []))}  
-        **Compliance Rate:** {creatives_result.get('compliance_rate', 0):.1%}
-        """)
-        
-        for creative_set in creatives:
-            sku = creative_set.get("sku")
-            variants = creative_set.get("variants", [])
-            
-            with st.expander(f"📦 {sku}", expanded=True):
-                for idx, variant in enumerate(variants):
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        st.markdown(f"**Variant {idx + 1}:**")
-                        st.info(variant.get("text", ""))
-                    
-                    with col2:
-                        compliant = variant.get("compliant", True)
-                        if compliant:
-                            st.success("✅ Compliant")
-                        else:
-                            st.error("❌ Violations")
-                            violations = variant.get("violations", [])
-                            for v in violations:
-                                st.caption(f"- {v}")
+        _tab_creatives()
 
 else:
-    # Initial state - show instructions
-    st.info("""
-    👈 Configure your demo settings in the sidebar and click **Run Demo** to see:
-    
-    1. **Clean Room vs Full Data Comparison** - See the performance delta
-    2. **Federation Graph** - Visualize adapter composition
-    3. **Plan Details** - Compare optimization results
-    4. **Creative Generation** - Brand-compliant ad copy
-    """)
-    
-    # Show example federation architecture
-    st.markdown("### 🏗️ Federation Architecture")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **Generic LLM**
-        - Base reasoning
-        - Tool use
-        - Schema comprehension
-        """)
-    
-    with col2:
-        st.markdown("""
-        **+ Industry LoRA**
-        - RMIS schema
-        - Clean room protocols
-        - Campaign metrics
-        """)
-    
-    with col3:
-        st.markdown("""
-        **+ Manufacturer LoRA**
-        - Brand tone
-        - Private metrics
-        - Product hierarchies
-        """)
-    
-    st.markdown("---")
-    
-    # Value proposition
-    st.markdown("### 💎 Why Federation?")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        **Clean Room Limitations:**
-        - ❌ No margin/profitability data
-        - ❌ No inventory levels
-        - ❌ No promotional flags
-        - ❌ Aggregated data only
-        - ❌ Limited SKU coverage
-        """)
-    
-    with col2:
-        st.markdown("""
-        **Federation Advantages:**
-        - ✅ Full data access via manufacturer adapter
-        - ✅ Stock-out avoidance
-        - ✅ Promotional timing optimization
-        - ✅ Margin-aware allocation
-        - ✅ 50% more SKUs optimized
-        """)
+    # Initial state - instructions, federation architecture and value proposition
+    st.html(FEDERATION_OVERVIEW_HTML)
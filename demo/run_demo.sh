@@ -22,16 +22,16 @@ echo "   ✅ Dependencies installed"
 # Generate synthetic data
 echo ""
 echo "🎲 Generating synthetic data..."
-python3 generate_synthetic_data.py
+python3 generate_synthetic_data.py  # add --csv to also write CSV files
 echo "   ✅ Data generated"
 
 # Check if data was created
 if [ -d "data" ]; then
     echo ""
     echo "📁 Data files created:"
-    echo "   - $(ls -1 data/retailer_alpha/*.csv 2>/dev/null | wc -l) Alpha files"
+    echo "   - $(ls -1 data/retailer_alpha/*.feather 2>/dev/null | wc -l) Alpha files"
     echo "   - $(ls -1 data/retailer_beta/*.jsonl 2>/dev/null | wc -l) Beta files"
-    echo "   - $(ls -1 data/*.csv 2>/dev/null | wc -l) catalog files"
+    echo "   - $(ls -1 data/*.feather 2>/dev/null | wc -l) catalog files"
 else
     echo "   ⚠️  Warning: Data directory not found"
 fi
@@ -1,15 +1,23 @@
-"""Demo tools for RMN LoRA system."""
-
-from .warehouse import WarehouseManager
-from .optimizer import BudgetOptimizer
-from .policy import PolicyChecker
-from .creatives import CreativeGenerator
-from .experiments import ExperimentDesigner
-
-__all__ = [
-    'WarehouseManager',
-    'BudgetOptimizer',
-    'PolicyChecker',
-    'CreativeGenerator',
-    'ExperimentDesigner'
-]
+"""Demo tools for RMN LoRA system.
+
+Tool classes are imported on first attribute access (PEP 562), so importing
+one submodule does not load the others and their dependencies.
+"""
+
+from importlib import import_module
+
+_TOOL_MODULES = {
+    'WarehouseManager': '.warehouse',
+    'BudgetOptimizer': '.optimizer',
+    'PolicyChecker': '.policy',
+    'CreativeGenerator': '.creatives',
+    'ExperimentDesigner': '.experiments',
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name):
+    if name in _TOOL_MODULES:
+        return getattr(import_module(_TOOL_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
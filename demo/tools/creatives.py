@@ -126,24 +126,65 @@ class CreativeGenerator:
                 headline = random.choice(templates['headlines']).format(product=product_name)
                 body = random.choice(templates['bodies']).format(product=product_name)
                 
-                # Check policy compliance
-                policy_result = self.policy_checker.check_creative(headline, body, retailer)
-                
-                creative = {
+                creatives.append({
                     'sku': sku,
                     'product_name': product_name,
                     'headline': headline,
                     'body': body,
                     'tone': tone,
-                    'retailer': retailer,
-                    'policy_pass': policy_result['pass'],
-                    'policy_reasons': policy_result['reasons']
-                }
-                
-                creatives.append(creative)
+                    'retailer': retailer
+                })
+        
+        # Check policy compliance for all variants in one call
+        policy_results = self.policy_checker.check_creative_batch(
+            [creative['headline'] for creative in creatives],
+            [creative['body'] for creative in creatives],
+            retailer
+        )
+        
+        for creative, policy_result in zip(creatives, policy_results):
+            creative['policy_pass'] = policy_result['pass']
+            creative['policy_reasons'] = policy_result['reasons']
         
         return creatives
     
+    def generate_variants_batch(
+        self,
+        product_names: List[str],
+        num_variants: int = 2,
+        tone: str = 'professional'
+    ) -> List[List[Dict]]:
+        """
+        Generate copy variants for several products in one call.
+        
+        Args:
+            product_names: Product display names
+            num_variants: Number of variants per product
+            tone: Creative tone
+        
+        Returns:
+            One list of variant dicts per product, in input order
+        """
+        templates = self.templates.get(tone.lower(), self.templates['professional'])
+        headlines = templates['headlines']
+        bodies = templates['bodies']
+        
+        variant_sets = []
+        for product_name in product_names:
+            variants = []
+            for _ in range(num_variants):
+                headline = random.choice(headlines).format(product=product_name)
+                body = random.choice(bodies).format(product=product_name)
+                variants.append({
+                    'headline': headline,
+                    'body': body,
+                    'text': f"{headline}. {body}",
+                    'tone': tone
+                })
+            variant_sets.append(variants)
+        
+        return variant_sets
+    
     def fix_violations(self, creative: Dict) -> Dict:
         """
         Attempt to fix policy violations.
@@ -0,0 +1,30 @@
+"""Readers for generated demo data files."""
+
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+
+
+def table_path(csv_path: Path) -> Optional[Path]:
+    """Path ``read_table`` would read for ``csv_path``, or None if neither file exists."""
+    feather_path = csv_path.with_suffix(".feather")
+    if feather_path.exists():
+        return feather_path
+    if csv_path.exists():
+        return csv_path
+    return None
+
+
+def read_table(csv_path: Path) -> Optional[pd.DataFrame]:
+    """Read a generated table, preferring its Feather sibling over the CSV.
+    
+    generate_synthetic_data.py writes ``<name>.feather`` by default and only
+    writes ``<name>.csv`` with ``--csv``; either one is accepted here.
+    Returns None when neither file exists.
+    """
+    path = table_path(csv_path)
+    if path is None:
+        return None
+    if path.suffix == ".feather":
+        return pd.read_feather(path)
+    return pd.read_csv(path)
@@ -1,10 +1,11 @@
 """Experiment design and measurement."""
 
 import pandas as pd
-import numpy as np
 from typing import Dict, List
 from pathlib import Path
 
+from .data_io import read_table
+
 
 class ExperimentDesigner:
     """Design and analyze experiments."""
@@ -17,9 +18,7 @@ class ExperimentDesigner:
     
     def _load_geo_data(self):
         """Load geographic regions."""
-        geo_path = self.data_dir / "geo_regions.csv"
-        if geo_path.exists():
-            self.geo_regions = pd.read_csv(geo_path)
+        self.geo_regions = read_table(self.data_dir / "geo_regions.csv")
     
     def design_experiment(
         self,
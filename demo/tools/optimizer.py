@@ -1,9 +1,12 @@
 """Budget optimizer with LP solver."""
 
+import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from .data_io import read_table
+
 try:
     import pulp as pl
     HAS_PULP = True
@@ -12,6 +15,22 @@ except ImportError:
     print("Warning: PuLP not installed. Using simplified optimizer.")
 
 
+def _tool_calls(budget: float, roas_floor: float, exp_share: float) -> list:
+    """Tool-call trail for a plan, with each call's args pre-rendered as JSON."""
+    calls = [
+        {'function': 'get_uplift_priors', 'args': {'granularity': 'sku'}},
+        {'function': 'fetch_metrics', 'args': {'window': '30d'}},
+        {'function': 'allocate_budget', 'args': {
+            'budget': budget,
+            'roas_floor': roas_floor,
+            'exp_share': exp_share
+        }}
+    ]
+    for call in calls:
+        call['formatted'] = json.dumps(call['args'], indent=2)
+    return calls
+
+
 class BudgetOptimizer:
     """Budget allocation optimizer using linear programming."""
     
@@ -24,14 +43,8 @@ class BudgetOptimizer:
     
     def _load_data(self):
         """Load uplift priors and SKU data."""
-        priors_path = self.data_dir / "uplift_priors.csv"
-        skus_path = self.data_dir / "sku_catalog.csv"
-        
-        if priors_path.exists():
-            self.priors = pd.read_csv(priors_path)
-        
-        if skus_path.exists():
-            self.skus = pd.read_csv(skus_path)
+        self.priors = read_table(self.data_dir / "uplift_priors.csv")
+        self.skus = read_table(self.data_dir / "sku_catalog.csv")
     
     def generate_plan(
         self,
@@ -78,73 +91,70 @@ class BudgetOptimizer:
         # Filter out OOS SKUs
         df = df[df['stock_probability'] >= (1 - oos_threshold)]
         
+        # Per-row coefficients as float64 arrays (no per-row .loc lookups below)
+        ice = df['ice'].to_numpy(dtype=np.float64)
+        margin = df['margin_pct'].to_numpy(dtype=np.float64)
+        price = df['price'].to_numpy(dtype=np.float64)
+        
         # Create decision variables
         prob = pl.LpProblem("rmn_allocation", pl.LpMaximize)
         
         # Variables: spend per (retailer, placement, audience, sku)
         indices = list(df.index)
         x = pl.LpVariable.dicts("spend", indices, lowBound=0)
+        spend_vars = [x[i] for i in indices]
+        total_spend_expr = pl.lpSum(spend_vars)
         
         # Objective: maximize incremental margin
-        prob += pl.lpSum([
-            x[i] * df.loc[i, 'ice'] * df.loc[i, 'margin_pct']
-            for i in indices
-        ])
+        prob += pl.LpAffineExpression(list(zip(spend_vars, (ice * margin).tolist())))
         
         # Constraint 1: Total budget
-        prob += pl.lpSum([x[i] for i in indices]) == budget
+        prob += total_spend_expr == budget
         
         # Constraint 2: ROAS floor (incremental)
         prob += (
-            pl.lpSum([x[i] * df.loc[i, 'ice'] * df.loc[i, 'price'] for i in indices]) >=
-            roas_floor * pl.lpSum([x[i] for i in indices])
+            pl.LpAffineExpression(list(zip(spend_vars, (ice * price).tolist()))) >=
+            roas_floor * total_spend_expr
         )
         
         # Constraint 3: Experiment reserve
         # Mark top 10% of combinations for experiment
-        df['exp_flag'] = np.random.random(len(df)) < 0.1
-        exp_indices = df[df['exp_flag']].index.tolist()
+        exp_flag = np.random.random(len(df)) < 0.1
         
-        if exp_indices:
-            prob += pl.lpSum([x[i] for i in exp_indices]) >= exp_share * budget
+        if exp_flag.any():
+            prob += pl.lpSum([v for v, flag in zip(spend_vars, exp_flag) if flag]) >= exp_share * budget
         
         # Solve
         prob.solve(pl.PULP_CBC_CMD(msg=False))
         
-        # Extract solution
-        allocation = []
-        total_spend = 0
-        total_conversions = 0
-        total_revenue = 0
+        # Extract solution, column-wise
+        spend = np.array([v.value() or 0.0 for v in spend_vars], dtype=np.float64)
+        keep = spend > 100  # Only include meaningful allocations
+        kept = df[keep]
+        kept_spend = spend[keep]
+        conversions = kept_spend * ice[keep]
+        revenue = conversions * price[keep]
         
-        for i in indices:
-            spend_val = x[i].value()
-            if spend_val and spend_val > 100:  # Only include meaningful allocations
-                row = df.loc[i]
-                conversions = spend_val * row['ice']
-                revenue = conversions * row['price']
-                
-                allocation.append({
-                    'Retailer': row['retailer'].title(),
-                    'Placement': row['placement'].replace('_', ' ').title(),
-                    'Audience': row['audience'].title(),
-                    'SKU': row['sku'],
-                    'Spend': f"${spend_val:,.0f}",
-                    'Expected Conversions': f"{conversions:.0f}",
-                    'Expected Revenue': f"${revenue:,.0f}",
-                    'Expected ROAS': f"{revenue / spend_val:.2f}x" if spend_val > 0 else "N/A",
-                    'Experiment': '🧪' if i in exp_indices else ''
-                })
-                
-                total_spend += spend_val
-                total_conversions += conversions
-                total_revenue += revenue
+        allocation_df = pd.DataFrame({
+            'Retailer': kept['retailer'].astype(str).str.title().to_numpy(),
+            'Placement': kept['placement'].astype(str).str.replace('_', ' ').str.title().to_numpy(),
+            'Audience': kept['audience'].astype(str).str.title().to_numpy(),
+            'SKU': kept['sku'].astype(str).to_numpy(),
+            'Spend': [f"${v:,.0f}" for v in kept_spend],
+            'Expected Conversions': [f"{v:.0f}" for v in conversions],
+            'Expected Revenue': [f"${v:,.0f}" for v in revenue],
+            'Expected ROAS': [f"{r / v:.2f}x" for r, v in zip(revenue, kept_spend)],
+            'Experiment': np.where(exp_flag[keep], '🧪', '')
+        })
         
         # Sort by spend
-        allocation_df = pd.DataFrame(allocation).sort_values('Spend', ascending=False)
+        allocation_df = allocation_df.sort_values('Spend', ascending=False)
+        
+        total_spend = float(kept_spend.sum())
+        total_revenue = float(revenue.sum())
         
         expected_roas = total_revenue / total_spend if total_spend > 0 else 0
-        experiment_budget = sum(x[i].value() or 0 for i in exp_indices)
+        experiment_budget = float(spend[exp_flag].sum())
         
         return {
             'budget': budget,
@@ -152,15 +162,7 @@ class BudgetOptimizer:
             'incremental_revenue': total_revenue,
             'experiment_budget': experiment_budget,
             'allocation': allocation_df,
-            'tool_calls': [
-                {'function': 'get_uplift_priors', 'args': {'granularity': 'sku'}},
-                {'function': 'fetch_metrics', 'args': {'window': '30d'}},
-                {'function': 'allocate_budget', 'args': {
-                    'budget': budget,
-                    'roas_floor': roas_floor,
-                    'exp_share': exp_share
-                }}
-            ],
+            'tool_calls': _tool_calls(budget, roas_floor, exp_share),
             'rationale': [
                 f"Allocated ${budget:,.0f} across {len(allocation_df)} combinations",
                 f"Expected blended ROAS: {expected_roas:.2f}x (target: {roas_floor:.2f}x)",
@@ -251,15 +253,7 @@ class BudgetOptimizer:
             'incremental_revenue': budget * 3.5,
             'experiment_budget': budget * exp_share,
             'allocation': allocation_df,
-            'tool_calls': [
-                {'function': 'get_uplift_priors', 'args': {'granularity': 'sku'}},
-                {'function': 'fetch_metrics', 'args': {'window': '30d'}},
-                {'function': 'allocate_budget', 'args': {
-                    'budget': budget,
-                    'roas_floor': roas_floor,
-                    'exp_share': exp_share
-                }}
-            ],
+            'tool_calls': _tool_calls(budget, roas_floor, exp_share),
             'rationale': [
                 f"Allocated ${budget:,.0f} across 6 high-performing combinations",
                 f"Expected blended ROAS: 3.5x (target: {roas_floor:.2f}x)",
@@ -25,6 +25,15 @@ class PolicyChecker:
                 'tone': 'casual'
             }
         }
+        
+        # One precompiled, case-insensitive alternation of disallowed terms per retailer
+        self._disallowed_re = {
+            retailer_id: re.compile(
+                r'\b(?:' + '|'.join(map(re.escape, policy['disallowed_terms'])) + r')\b',
+                re.IGNORECASE
+            )
+            for retailer_id, policy in self.policies.items()
+        }
     
     def check(self, text: str, retailer_id: str, field: str = 'body') -> Dict:
         """
@@ -38,7 +47,13 @@ class PolicyChecker:
         Returns:
             Dict with pass/fail and reasons
         """
-        policy = self.policies.get(retailer_id.lower(), {})
+        retailer_id = retailer_id.lower()
+        return self._check(
+            text, self.policies.get(retailer_id, {}), self._disallowed_re.get(retailer_id), field
+        )
+    
+    def _check(self, text: str, policy: Dict, disallowed_re, field: str) -> Dict:
+        """Check one text against an already-resolved policy and term pattern."""
         reasons = []
         
         # Check length
@@ -51,11 +66,12 @@ class PolicyChecker:
             if len(text) > max_len:
                 reasons.append(f"Body exceeds {max_len} chars ({len(text)} chars)")
         
-        # Check disallowed terms
-        disallowed = policy.get('disallowed_terms', [])
-        for term in disallowed:
-            if re.search(r'\b' + re.escape(term) + r'\b', text, re.IGNORECASE):
-                reasons.append(f"Contains disallowed term: '{term}'")
+        # Check disallowed terms: one scan, reported in policy order
+        if disallowed_re is not None:
+            found = {match.lower() for match in disallowed_re.findall(text)}
+            for term in policy.get('disallowed_terms', []):
+                if term.lower() in found:
+                    reasons.append(f"Contains disallowed term: '{term}'")
         
         # Check required disclaimers (for body only)
         if field == 'body':
@@ -69,6 +85,23 @@ class PolicyChecker:
             'reasons': reasons
         }
     
+    def check_batch(self, texts: List[str], retailer_id: str, field: str = 'body') -> List[Dict]:
+        """
+        Check several texts against the same policy.
+        
+        Args:
+            texts: Texts to check
+            retailer_id: Retailer identifier
+            field: 'headline' or 'body'
+        
+        Returns:
+            One pass/fail result dict per text, in input order
+        """
+        retailer_id = retailer_id.lower()
+        policy = self.policies.get(retailer_id, {})
+        disallowed_re = self._disallowed_re.get(retailer_id)
+        return [self._check(text, policy, disallowed_re, field) for text in texts]
+    
     def check_creative(self, headline: str, body: str, retailer_id: str) -> Dict:
         """
         Check complete creative.
@@ -83,7 +116,32 @@ class PolicyChecker:
         """
         headline_result = self.check(headline, retailer_id, 'headline')
         body_result = self.check(body, retailer_id, 'body')
+        return self._combine(headline_result, body_result)
+    
+    def check_creative_batch(
+        self,
+        headlines: List[str],
+        bodies: List[str],
+        retailer_id: str
+    ) -> List[Dict]:
+        """
+        Check several complete creatives against the same policy.
+        
+        Args:
+            headlines: Headline texts
+            bodies: Body texts, aligned with ``headlines``
+            retailer_id: Retailer identifier
         
+        Returns:
+            One result dict per creative (as from ``check_creative``), in input order
+        """
+        headline_results = self.check_batch(headlines, retailer_id, 'headline')
+        body_results = self.check_batch(bodies, retailer_id, 'body')
+        return [self._combine(h, b) for h, b in zip(headline_results, body_results)]
+    
+    @staticmethod
+    def _combine(headline_result: Dict, body_result: Dict) -> Dict:
+        """Merge headline and body results into a creative-level result."""
         all_reasons = headline_result['reasons'] + body_result['reasons']
         
         return {
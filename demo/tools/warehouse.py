@@ -4,8 +4,9 @@ import duckdb
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import json
-import yaml
+from typing import Optional
+
+from .data_io import read_table, table_path
 
 
 class WarehouseManager:
@@ -58,26 +59,30 @@ class WarehouseManager:
             )
         """)
     
+    def source_path(self, retailer: str) -> Optional[Path]:
+        """Raw data file ``load_retailer_data`` reads for a retailer, if present."""
+        if retailer == "alpha":
+            return table_path(self.data_dir / "retailer_alpha" / "events.csv")
+        if retailer == "beta":
+            log_path = self.data_dir / "retailer_beta" / "log.jsonl"
+            return log_path if log_path.exists() else None
+        return None
+    
     def load_retailer_data(self, retailer: str) -> bool:
         """Load raw retailer data."""
         try:
             if retailer == "alpha":
                 # Load Alpha CSV files
-                events_path = self.data_dir / "retailer_alpha" / "events.csv"
-                if events_path.exists():
-                    df = pd.read_csv(events_path)
+                df = read_table(self.data_dir / "retailer_alpha" / "events.csv")
+                if df is not None:
                     self.conn.execute("CREATE OR REPLACE TABLE raw_alpha_events AS SELECT * FROM df")
                     return True
             
             elif retailer == "beta":
-                # Load Beta JSONL
+                # Load Beta JSONL (parsed column-wise; no per-line dict round trip)
                 log_path = self.data_dir / "retailer_beta" / "log.jsonl"
                 if log_path.exists():
-                    records = []
-                    with open(log_path) as f:
-                        for line in f:
-                            records.append(json.loads(line))
-                    df = pd.DataFrame(records)
+                    df = pd.read_json(log_path, lines=True, dtype=False, convert_dates=False)
                     self.conn.execute("CREATE OR REPLACE TABLE raw_beta_events AS SELECT * FROM df")
                     return True
             
@@ -101,6 +106,9 @@ class WarehouseManager:
     def _harmonize_alpha(self) -> dict:
         """Harmonize Retailer Alpha to RMIS."""
         
+        # Replace this retailer's rows, so re-harmonizing never duplicates them
+        self.conn.execute("DELETE FROM rmis_events WHERE retailer_id = 'alpha'")
+        
         # Mapping logic
         sql = """
             INSERT INTO rmis_events
@@ -164,6 +172,9 @@ class WarehouseManager:
     def _harmonize_beta(self) -> dict:
         """Harmonize Retailer Beta to RMIS."""
         
+        # Replace this retailer's rows, so re-harmonizing never duplicates them
+        self.conn.execute("DELETE FROM rmis_events WHERE retailer_id = 'beta'")
+        
         # Mapping logic with EUR to USD conversion
         sql = """
             INSERT INTO rmis_events
@@ -258,9 +269,8 @@ class WarehouseManager:
     
     def load_sku_catalog(self):
         """Load SKU catalog."""
-        sku_path = self.data_dir / "sku_catalog.csv"
-        if sku_path.exists():
-            df = pd.read_csv(sku_path)
+        df = read_table(self.data_dir / "sku_catalog.csv")
+        if df is not None:
             self.conn.execute("DELETE FROM rmis_skus")
             self.conn.execute("""
                 INSERT INTO rmis_skus 
@@ -296,6 +306,11 @@ class WarehouseManager:
         
         return self.conn.execute(sql).df()
     
+    def count(self, table: str) -> int:
+        """Count rows in a warehouse table without materializing them."""
+        result = self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+        return result[0] if result else 0
+    
     def close(self):
         """Close connection."""
         self.conn.close()